@@ -7,6 +7,7 @@ from .astar import a_star_search
 from .ida_star import ida_star_search
 from .bidirectional import bidirectional_search
 from .bidirectionalAstar import bidirectional_a_star_search
+from .jps_plus import jps_plus_search
 
 __all__ = [
     "SearchResult",
@@ -18,6 +19,7 @@ __all__ = [
     "a_star_search",
     "ida_star_search",
     "bidirectional_search",
-    'bidirectional_a_star_search'
+    'bidirectional_a_star_search',
+    "jps_plus_search",
 ]
 
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+Entry = Tuple[Any, ...]
+
+
+class BucketQueue:
+    """Monotone priority queue for small non-negative integer keys (Dial's algorithm).
+
+    Entries are tuples led by their priority, as with ``heapq``, so callers
+    can swap one for the other; later fields ride along uncompared. They are
+    stored in one list per priority and a cursor walks forward to the lowest
+    non-empty bucket, giving O(1) amortized push and pop while keys arrive in
+    non-decreasing order (true for A* with a consistent heuristic). A lower
+    key simply moves the cursor back. Within a bucket the newest entry pops
+    first.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._buckets: List[List[Entry]] = [[] for _ in range(max(1, capacity))]
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, entry: Entry) -> None:
+        priority = entry[0]
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(entry)
+        if priority < self._cursor:
+            self._cursor = priority
+        self._size += 1
+
+    def pop(self) -> Entry:
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+        self._size -= 1
+        return buckets[cursor].pop()
@@ -1,50 +1,67 @@
 from __future__ import annotations
 
-import heapq
-from typing import Dict, Optional, Set
+from functools import partial
+from heapq import heappop, heappush
 
-from .base import SearchResult, path_cost, reconstruct_path
-from src.grid import Grid, Position
-
-
-def _heuristic(a: Position, b: Position) -> float:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+from ._bucket_pq import BucketQueue
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    flat_search_state,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def a_star_search(grid: Grid) -> SearchResult:
-    start, goal = grid.start, grid.goal
-    frontier: list[tuple[float, Position]] = [(0.0, start)]
-    g_costs: Dict[Position, float] = {start: 0.0}
-    parent: Dict[Position, Optional[Position]] = {start: None}
-    visited: Set[Position] = set()
+    rows, cols = grid.rows, grid.cols
+    adjacency, weights = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    h = grid.manhattan_to(grid.goal)
+    # Integer weights plus the integer Manhattan heuristic keep every f-score
+    # integral, which lets a bucket queue replace the binary heap. Ties on f
+    # go to the node with the larger g (the one nearer the goal): the heap
+    # entries carry ``-g`` for that, while a bucket pops its newest entry,
+    # which is already the deepest one pushed.
+    if all(w.is_integer() for w in weights):
+        weights = [int(w) for w in weights]
+        frontier = BucketQueue(h[start] * max(weights) + 1)
+        push, pop = frontier.push, frontier.pop
+    else:
+        frontier = []
+        push, pop = partial(heappush, frontier), partial(heappop, frontier)
+    push((h[start], 0, start))
+    visited, g_costs, parent = flat_search_state(rows * cols)
+    g_costs[start] = 0
     visited_order = [start]
 
     while frontier:
-        f_score, current = heapq.heappop(frontier)
-        if current in visited:
+        current = pop()[-1]
+        if visited[current]:
             continue
-        visited.add(current)
+        visited[current] = 1
         if current == goal:
             break
-        for neighbor in grid.neighbors(current):
-            tentative_g = g_costs[current] + grid.cost(current, neighbor)
-            if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
+        for neighbor in adjacency[current]:
+            tentative_g = g_costs[current] + weights[neighbor]
+            if tentative_g < g_costs[neighbor]:
                 g_costs[neighbor] = tentative_g
                 parent[neighbor] = current
-                f = tentative_g + _heuristic(neighbor, goal)
-                heapq.heappush(frontier, (f, neighbor))
+                push((tentative_g + h[neighbor], -tentative_g, neighbor))
                 visited_order.append(neighbor)
 
-    success = goal in parent
-    path = reconstruct_path(parent, goal) if success else []
-    cost = path_cost(grid, path) if success else float("inf")
+    success = g_costs[goal] != UNREACHABLE
+    path = NodeSequence(reconstruct_path(parent, goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="A*",
         path=path,
         cost=cost,
-        explored_nodes=len(visited),
+        explored_nodes=visited.count(1),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
@@ -1,37 +1,113 @@
 from __future__ import annotations
 
 import time
+from array import array
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, overload
 
 from src.grid import Grid, Position
 
+# Cost of a node no search has reached, and ``SearchResult.cost`` when there
+# is no path. It stays a plain float so costs compare and sum without casts.
+UNREACHABLE = float("inf")
+
+
+class NodeSequence(Sequence[Position]):
+    """Read-only sequence of ``(row, col)`` positions stored as packed node ids.
+
+    The ids (``row * cols + col``) live in an ``array('i')``, four bytes per
+    node instead of a tuple of two ints; positions are only built when an item
+    is read, e.g. while rendering an animation step.
+    """
+
+    __slots__ = ("ids", "cols")
+
+    def __init__(self, ids: Iterable[int], cols: int) -> None:
+        self.ids = ids if isinstance(ids, array) else array("i", ids)
+        self.cols = cols
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Position: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "NodeSequence": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NodeSequence(self.ids[index], self.cols)
+        return divmod(self.ids[index], self.cols)
+
+    def __iter__(self) -> Iterator[Position]:
+        cols = self.cols
+        return (divmod(idx, cols) for idx in self.ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NodeSequence) and other.cols == self.cols:
+            return self.ids == other.ids
+        if isinstance(other, (list, tuple, NodeSequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NodeSequence({self.positions()!r})"
+
+    def positions(self) -> List[Position]:
+        """Materialise every position as a list of tuples."""
+        return index_positions(self.ids, self.cols)
+
 
 @dataclass
 class SearchResult:
+    """Outcome of one search; a failed search has ``cost == UNREACHABLE``.
+
+    ``applicable`` is False when the algorithm does not handle this kind of
+    grid at all (JPS+ on weighted grids); such results are also unsuccessful.
+    """
+
     name: str
-    path: List[Position]
+    path: Sequence[Position]
     cost: float
     explored_nodes: int
     duration: float
     success: bool
-    visited_order: List[Position]
+    visited_order: Sequence[Position]
+    applicable: bool = True
 
 
 AlgorithmRunner = Callable[[Grid], SearchResult]
 
 
-def reconstruct_path(parent: Dict[Position, Optional[Position]], goal: Position) -> List[Position]:
-    path: List[Position] = []
+def index_positions(indices: Iterable[int], cols: int) -> List[Position]:
+    """Convert flat node ids back to ``(row, col)`` positions."""
+    return [divmod(idx, cols) for idx in indices]
+
+
+def flat_search_state(size: int) -> Tuple[bytearray, List[float], List[int]]:
+    """Preallocated visited bitmap, g-costs and parent ids for ``size`` nodes.
+
+    Unreached nodes have ``g == UNREACHABLE`` and ``parent == -1``.
+    """
+    return bytearray(size), [UNREACHABLE] * size, [-1] * size
+
+
+def reconstruct_path(parent: Sequence[int], goal: int) -> "array[int]":
+    """Node ids from the root of ``parent`` to ``goal``, ready for ``NodeSequence``."""
+    path: List[int] = []
     node = goal
-    while node is not None:
+    while node != -1:
         path.append(node)
-        node = parent.get(node)
-    path.reverse()
-    return path
+        node = parent[node]
+    return array("i", reversed(path))
 
 
 def path_cost(grid: Grid, path: Iterable[Position]) -> float:
+    if isinstance(path, NodeSequence) and path.cols == grid.cols:
+        # Sum entry costs straight from the flat weights, in path order.
+        weights = grid.flat_weights()[1]
+        return round(sum(map(weights.__getitem__, path.ids[1:]), 0.0), 4)
     cost = 0.0
     prev = None
     for pos in path:
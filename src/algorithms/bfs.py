@@ -1,42 +1,55 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Dict, Optional, Set
-
-from .base import SearchResult, path_cost, reconstruct_path
-from src.grid import Grid, Position
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def bfs(grid: Grid) -> SearchResult:
-    start = grid.start
-    goal = grid.goal
-    frontier: deque[Position] = deque([start])
-    visited: Set[Position] = {start}
-    parent: Dict[Position, Optional[Position]] = {start: None}
+    rows, cols = grid.rows, grid.cols
+    adjacency, _ = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    # ``parent`` doubles as the visited marker: the start points at itself
+    # while searching, so any id other than -1 means "already discovered".
+    parent = [-1] * (rows * cols)
+    parent[start] = start
     visited_order = [start]
 
+    # Sweep one whole BFS level at a time; the goal is tested as soon as it is
+    # discovered rather than when it would later be dequeued, since its parent
+    # (and so the path) is already fixed at that point.
+    frontier = [start] if start != goal else []
     while frontier:
-        current = frontier.popleft()
-        if current == goal:
-            break
-        for neighbor in grid.neighbors(current):
-            if neighbor in visited:
-                continue
-            visited.add(neighbor)
-            parent[neighbor] = current
-            frontier.append(neighbor)
-            visited_order.append(neighbor)
+        next_frontier: list[int] = []
+        for current in frontier:
+            for neighbor in adjacency[current]:
+                if parent[neighbor] != -1:
+                    continue
+                parent[neighbor] = current
+                next_frontier.append(neighbor)
+                if neighbor == goal:
+                    break
+            if parent[goal] != -1:
+                break
+        visited_order.extend(next_frontier)
+        frontier = next_frontier if parent[goal] == -1 else []
 
-    success = goal in parent
-    path = reconstruct_path(parent, goal) if success else []
-    cost = path_cost(grid, path) if success else float("inf")
+    success = parent[goal] != -1
+    parent[start] = -1
+    path = NodeSequence(reconstruct_path(parent, goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="BFS",
         path=path,
         cost=cost,
-        explored_nodes=len(visited),
+        explored_nodes=len(visited_order),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
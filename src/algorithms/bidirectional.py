@@ -1,94 +1,99 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Dict, Optional, Set
+from typing import List, Optional, Sequence, Tuple
 
-from .base import SearchResult, path_cost
-from src.grid import Grid, Position
+from .base import UNREACHABLE, NodeSequence, SearchResult, path_cost, reconstruct_path
+from src.grid import Adjacency, Grid
+
+
+# Bit flags in the shared ``seen`` bitmap, one per search direction.
+_FROM_START = 1
+_FROM_GOAL = 2
 
 
 def _reconstruct_bidirectional(
-    meet: Position,
-    parents_start: Dict[Position, Optional[Position]],
-    parents_goal: Dict[Position, Optional[Position]],
-) -> list[Position]:
+    meet: int,
+    parents_start: Sequence[int],
+    parents_goal: Sequence[int],
+) -> Sequence[int]:
     # Path from start to meeting node
-    path_start = []
-    node = meet
-    while node is not None:
-        path_start.append(node)
-        node = parents_start.get(node)
-    path_start.reverse()
+    path_start = reconstruct_path(parents_start, meet)
 
     # Path from meeting node to goal
     path_goal = []
-    node = parents_goal.get(meet)
-    while node is not None:
+    node = parents_goal[meet]
+    while node != -1:
         path_goal.append(node)
-        node = parents_goal.get(node)
-    return path_start + path_goal
+        node = parents_goal[node]
+    path_start.extend(path_goal)
+    return path_start
+
+
+def _expand_level(
+    frontier: List[int],
+    adjacency: Adjacency,
+    seen: bytearray,
+    side: int,
+    parents: List[int],
+    visited_order: List[int],
+) -> Tuple[List[int], Optional[int]]:
+    """Expand one whole BFS level for ``side``; stop early on meeting the other side."""
+    next_frontier: List[int] = []
+    for current in frontier:
+        for neighbor in adjacency[current]:
+            flags = seen[neighbor]
+            if flags & side:
+                continue
+            seen[neighbor] = flags | side
+            parents[neighbor] = current
+            visited_order.append(neighbor)
+            if flags:
+                return next_frontier, neighbor
+            next_frontier.append(neighbor)
+    return next_frontier, None
 
 
 def bidirectional_search(grid: Grid) -> SearchResult:
-    start, goal = grid.start, grid.goal
-    if start == goal:
-        return SearchResult("Bidirectional", [start], 0.0, 1, 0.0, True, [start])
+    if grid.start == grid.goal:
+        return SearchResult("Bidirectional", [grid.start], 0.0, 1, 0.0, True, [grid.start])
 
-    frontier_start = deque([start])
-    frontier_goal = deque([goal])
-    parents_start: Dict[Position, Optional[Position]] = {start: None}
-    parents_goal: Dict[Position, Optional[Position]] = {goal: None}
-    visited_start: Set[Position] = {start}
-    visited_goal: Set[Position] = {goal}
+    rows, cols = grid.rows, grid.cols
+    adjacency, _ = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    frontier_start = [start]
+    frontier_goal = [goal]
+    size = rows * cols
+    parents_start = [-1] * size
+    parents_goal = [-1] * size
+    seen = bytearray(size)
+    seen[start] = _FROM_START
+    seen[goal] = _FROM_GOAL
     visited_order = [start, goal]
-    meet_node: Optional[Position] = None
-
-    while frontier_start and frontier_goal:
-        # Expand from start side
-        for _ in range(len(frontier_start)):
-            current = frontier_start.popleft()
-            for neighbor in grid.neighbors(current):
-                if neighbor in visited_start:
-                    continue
-                visited_start.add(neighbor)
-                parents_start[neighbor] = current
-                visited_order.append(neighbor)
-                if neighbor in visited_goal:
-                    meet_node = neighbor
-                    break
-                frontier_start.append(neighbor)
-            if meet_node:
-                break
-        if meet_node:
-            break
+    meet_node: Optional[int] = None
 
-        # Expand from goal side
-        for _ in range(len(frontier_goal)):
-            current = frontier_goal.popleft()
-            for neighbor in grid.neighbors(current):
-                if neighbor in visited_goal:
-                    continue
-                visited_goal.add(neighbor)
-                parents_goal[neighbor] = current
-                visited_order.append(neighbor)
-                if neighbor in visited_start:
-                    meet_node = neighbor
-                    break
-                frontier_goal.append(neighbor)
-            if meet_node:
-                break
+    # Always grow the side with the smaller frontier by one full level; this
+    # keeps the two searches balanced around obstacles that choke one side.
+    while frontier_start and frontier_goal and meet_node is None:
+        if len(frontier_start) <= len(frontier_goal):
+            frontier_start, meet_node = _expand_level(
+                frontier_start, adjacency, seen, _FROM_START, parents_start, visited_order
+            )
+        else:
+            frontier_goal, meet_node = _expand_level(
+                frontier_goal, adjacency, seen, _FROM_GOAL, parents_goal, visited_order
+            )
 
     success = meet_node is not None
-    path = _reconstruct_bidirectional(meet_node, parents_start, parents_goal) if success else []
-    explored_nodes = len(visited_start | visited_goal)
-    cost = path_cost(grid, path) if success else float("inf")
+    path = NodeSequence(_reconstruct_bidirectional(meet_node, parents_start, parents_goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="Bidirectional",
         path=path,
         cost=cost,
-        explored_nodes=explored_nodes,
+        # The meeting node is appended by both sides.
+        explored_nodes=len(visited_order) - success,
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
@@ -1,118 +1,143 @@
 from __future__ import annotations
 
-import heapq
-from typing import Dict, Optional, Set
+from heapq import heappop, heappush
+from typing import List, Optional, Sequence, Tuple
 
-from .base import SearchResult, path_cost
-from src.grid import Grid, Position
-
-
-def _heuristic(a: Position, b: Position) -> float:
-    # Manhattan distance
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    flat_search_state,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def _reconstruct_bidirectional_astar(
-    meet: Position,
-    parents_start: Dict[Position, Optional[Position]],
-    parents_goal: Dict[Position, Optional[Position]],
-) -> list[Position]:
+    meet: Optional[int],
+    parents_start: Sequence[int],
+    parents_goal: Sequence[int],
+) -> Sequence[int]:
     if meet is None:
         return []
 
     # Path from start to meet
-    path_start = []
-    node = meet
-    while node is not None:
-        path_start.append(node)
-        node = parents_start.get(node)
-    path_start.reverse()  # now start -> meet
+    path_start = reconstruct_path(parents_start, meet)
 
     # Path from meet to goal
     path_goal = []
-    node = parents_goal.get(meet)
-    while node is not None:
+    node = parents_goal[meet]
+    while node != -1:
         path_goal.append(node)
-        node = parents_goal.get(node)
+        node = parents_goal[node]
 
-    return path_start + path_goal
+    path_start.extend(path_goal)
+    return path_start
 
 
-def bidirectional_a_star_search(grid: Grid) -> SearchResult:
-    start, goal = grid.start, grid.goal
-    if start == goal:
-        return SearchResult("Bidirectional A*", [start], 0.0, 1, 0.0, True, [start])
-
-    frontier_start = [(0.0, start)]
-    frontier_goal = [(0.0, goal)]
+def _discard_stale(frontier: List[Tuple[float, float, int]], closed: bytearray, g_costs: Sequence[float]) -> None:
+    # Drop top entries for closed nodes or nodes since reached more cheaply.
+    while frontier:
+        _, g, node = frontier[0]
+        if not closed[node] and g <= g_costs[node]:
+            return
+        heappop(frontier)
 
-    g_start: Dict[Position, float] = {start: 0.0}
-    g_goal: Dict[Position, float] = {goal: 0.0}
 
-    parents_start: Dict[Position, Optional[Position]] = {start: None}
-    parents_goal: Dict[Position, Optional[Position]] = {goal: None}
-
-    visited_start: Set[Position] = set()
-    visited_goal: Set[Position] = set()
+def bidirectional_a_star_search(grid: Grid) -> SearchResult:
+    if grid.start == grid.goal:
+        return SearchResult("Bidirectional A*", [grid.start], 0.0, 1, 0.0, True, [grid.start])
+
+    rows, cols = grid.rows, grid.cols
+    adjacency, weights = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    to_goal = grid.manhattan_to(grid.goal)
+    to_start = grid.manhattan_to(grid.start)
+
+    # Entries are (priority, g, node). Following MM, the priority is
+    # max(f, 2g) so neither search runs past the midpoint of the optimal path,
+    # and the smaller of the two frontier tops is a lower bound on any path not
+    # yet found. g_goal[n] is the forward cost from n to the goal, so the two
+    # halves of a path through n add up to g_start[n] + g_goal[n].
+    frontier_start = [(0.0, 0.0, start)]
+    frontier_goal = [(0.0, 0.0, goal)]
+
+    visited_start, g_start, parents_start = flat_search_state(rows * cols)
+    visited_goal, g_goal, parents_goal = flat_search_state(rows * cols)
+    # Nodes expanded by either side, counted once even if reopened.
+    expanded = bytearray(rows * cols)
+    explored_nodes = 0
+    g_start[start] = 0.0
+    g_goal[goal] = 0.0
 
     visited_order = [start, goal]
-    meet_node: Optional[Position] = None
-    best_total_cost = float("inf")
-
-    while frontier_start or frontier_goal:
-        # Expand from START side
-        if frontier_start:
-            _, current = heapq.heappop(frontier_start)
-            if current not in visited_start:
-                visited_start.add(current)
-                for neighbor in grid.neighbors(current):
-                    tentative_g = g_start[current] + grid.cost(current, neighbor)
-                    if neighbor not in g_start or tentative_g < g_start[neighbor]:
-                        g_start[neighbor] = tentative_g
-                        parents_start[neighbor] = current
-                        f = tentative_g + _heuristic(neighbor, goal)
-                        heapq.heappush(frontier_start, (f, neighbor))
-                        visited_order.append(neighbor)
+    meet_node: Optional[int] = None
+    best_total_cost = UNREACHABLE
+
+    while True:
+        _discard_stale(frontier_start, visited_start, g_start)
+        _discard_stale(frontier_goal, visited_goal, g_goal)
+        if not frontier_start or not frontier_goal:
+            break
+        # Stop once no unexplored path can beat the best meeting found so far.
+        if best_total_cost <= min(frontier_start[0][0], frontier_goal[0][0]):
+            break
+
+        if frontier_start[0][0] <= frontier_goal[0][0]:
+            # Expand from START side
+            _, g_current, current = heappop(frontier_start)
+            visited_start[current] = 1
+            if not expanded[current]:
+                expanded[current] = 1
+                explored_nodes += 1
+            for neighbor in adjacency[current]:
+                tentative_g = g_current + weights[neighbor]
+                if tentative_g < g_start[neighbor]:
+                    g_start[neighbor] = tentative_g
+                    parents_start[neighbor] = current
+                    visited_start[neighbor] = 0
+                    f = tentative_g + to_goal[neighbor]
+                    heappush(frontier_start, (max(f, 2 * tentative_g), tentative_g, neighbor))
+                    visited_order.append(neighbor)
                     # Check if meet
-                    if neighbor in visited_goal:
-                        total_cost = tentative_g + g_goal[neighbor]
-                        if total_cost < best_total_cost:
-                            best_total_cost = total_cost
-                            meet_node = neighbor
-
-        # Expand from GOAL side
-        if frontier_goal:
-            _, current = heapq.heappop(frontier_goal)
-            if current not in visited_goal:
-                visited_goal.add(current)
-                for neighbor in grid.neighbors(current):
-                    tentative_g = g_goal[current] + grid.cost(current, neighbor)
-                    if neighbor not in g_goal or tentative_g < g_goal[neighbor]:
-                        g_goal[neighbor] = tentative_g
-                        parents_goal[neighbor] = current
-                        f = tentative_g + _heuristic(neighbor, start)
-                        heapq.heappush(frontier_goal, (f, neighbor))
-                        visited_order.append(neighbor)
+                    total_cost = tentative_g + g_goal[neighbor]
+                    if total_cost < best_total_cost:
+                        best_total_cost = total_cost
+                        meet_node = neighbor
+        else:
+            # Expand from GOAL side; stepping back into ``neighbor`` costs the
+            # weight of ``current``, the cell a forward move would enter.
+            _, g_current, current = heappop(frontier_goal)
+            visited_goal[current] = 1
+            if not expanded[current]:
+                expanded[current] = 1
+                explored_nodes += 1
+            step = weights[current]
+            for neighbor in adjacency[current]:
+                tentative_g = g_current + step
+                if tentative_g < g_goal[neighbor]:
+                    g_goal[neighbor] = tentative_g
+                    parents_goal[neighbor] = current
+                    visited_goal[neighbor] = 0
+                    f = tentative_g + to_start[neighbor]
+                    heappush(frontier_goal, (max(f, 2 * tentative_g), tentative_g, neighbor))
+                    visited_order.append(neighbor)
                     # Check if meet
-                    if neighbor in visited_start:
-                        total_cost = tentative_g + g_start[neighbor]
-                        if total_cost < best_total_cost:
-                            best_total_cost = total_cost
-                            meet_node = neighbor
-
-        # Early stop if the best_total_cost is found
-        if meet_node is not None and frontier_start and frontier_goal:
-            # Optional: break if the sum of min f-values exceeds best_total_cost
-            min_f_start = frontier_start[0][0] if frontier_start else float("inf")
-            min_f_goal = frontier_goal[0][0] if frontier_goal else float("inf")
-            if min_f_start + min_f_goal >= best_total_cost:
-                break
+                    total_cost = tentative_g + g_start[neighbor]
+                    if total_cost < best_total_cost:
+                        best_total_cost = total_cost
+                        meet_node = neighbor
 
     success = meet_node is not None
-    path = _reconstruct_bidirectional_astar(meet_node, parents_start, parents_goal) if success else []
+    path = (
+        NodeSequence(_reconstruct_bidirectional_astar(meet_node, parents_start, parents_goal), cols)
+        if success
+        else []
+    )
 
-    explored_nodes = len(visited_start | visited_goal)
-    cost = path_cost(grid, path) if success else float("inf")
+    cost = path_cost(grid, path) if success else UNREACHABLE
 
     return SearchResult(
         name="Bidirectional A*",
@@ -121,5 +146,5 @@ def bidirectional_a_star_search(grid: Grid) -> SearchResult:
         explored_nodes=explored_nodes,
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
@@ -1,41 +1,51 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, Set
-
-from .base import SearchResult, path_cost, reconstruct_path
-from src.grid import Grid, Position
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def dfs(grid: Grid) -> SearchResult:
-    start = grid.start
-    goal = grid.goal
+    rows, cols = grid.rows, grid.cols
+    adjacency, _ = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
     stack = [start]
-    visited: Set[Position] = {start}
-    parent: Dict[Position, Optional[Position]] = {start: None}
+    # As in bfs, a parent other than -1 marks a discovered node.
+    parent = [-1] * (rows * cols)
+    parent[start] = start
     visited_order = [start]
 
     while stack:
         current = stack.pop()
         if current == goal:
             break
-        for neighbor in grid.neighbors(current):
-            if neighbor in visited:
+        for neighbor in adjacency[current]:
+            if parent[neighbor] != -1:
                 continue
-            visited.add(neighbor)
             parent[neighbor] = current
             stack.append(neighbor)
             visited_order.append(neighbor)
+            if neighbor == goal:
+                # The goal's parent (and so the path) is fixed on discovery.
+                stack.clear()
+                break
 
-    success = goal in parent
-    path = reconstruct_path(parent, goal) if success else []
-    cost = path_cost(grid, path) if success else float("inf")
+    success = parent[goal] != -1
+    parent[start] = -1
+    path = NodeSequence(reconstruct_path(parent, goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="DFS",
         path=path,
         cost=cost,
-        explored_nodes=len(visited),
+        explored_nodes=len(visited_order),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
@@ -1,45 +1,57 @@
 from __future__ import annotations
 
-import heapq
-from typing import Dict, Optional, Set
+from heapq import heappop, heappush
 
-from .base import SearchResult, path_cost, reconstruct_path
-from src.grid import Grid, Position
-
-
-def _heuristic(a: Position, b: Position) -> float:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    flat_search_state,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def greedy_best_first(grid: Grid) -> SearchResult:
-    start, goal = grid.start, grid.goal
-    frontier: list[tuple[float, Position]] = [(_heuristic(start, goal), start)]
-    parent: Dict[Position, Optional[Position]] = {start: None}
-    visited: Set[Position] = {start}
+    rows, cols = grid.rows, grid.cols
+    adjacency, weights = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    h = grid.manhattan_to(grid.goal)
+    # Among nodes equally close to the goal, expand the one reached most
+    # cheaply first.
+    frontier: list[tuple[int, float, int]] = [(h[start], 0.0, start)]
+    visited, g_costs, parent = flat_search_state(rows * cols)
+    g_costs[start] = 0.0
+    visited[start] = 1
     visited_order = [start]
 
     while frontier:
-        _, current = heapq.heappop(frontier)
+        current = heappop(frontier)[2]
         if current == goal:
             break
-        for neighbor in grid.neighbors(current):
-            if neighbor in visited:
+        for neighbor in adjacency[current]:
+            if visited[neighbor]:
                 continue
-            visited.add(neighbor)
+            visited[neighbor] = 1
             parent[neighbor] = current
-            heapq.heappush(frontier, (_heuristic(neighbor, goal), neighbor))
+            g_costs[neighbor] = g = g_costs[current] + weights[neighbor]
+            heappush(frontier, (h[neighbor], g, neighbor))
             visited_order.append(neighbor)
+            if neighbor == goal:
+                frontier.clear()
+                break
 
-    success = goal in parent
-    path = reconstruct_path(parent, goal) if success else []
-    cost = path_cost(grid, path) if success else float("inf")
+    success = bool(visited[goal])
+    path = NodeSequence(reconstruct_path(parent, goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="Greedy Best-First",
         path=path,
         cost=cost,
-        explored_nodes=len(visited),
+        explored_nodes=visited.count(1),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
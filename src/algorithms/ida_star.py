@@ -1,64 +1,120 @@
 from __future__ import annotations
 
 from math import inf
-from typing import List, Set
+from typing import List, Tuple
 
-from .base import SearchResult, path_cost
-from src.grid import Grid, Position
+from .base import UNREACHABLE, NodeSequence, SearchResult, path_cost
+from src.grid import Grid
 
 
-def _heuristic(a: Position, b: Position) -> float:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+def ida_star_search(grid: Grid) -> SearchResult:
+    # With no route to the goal, IDA* only stops once every path under the
+    # bound has been enumerated, which grows exponentially with open area.
+    # A bitmap flood settles that case first.
+    if not grid.connected(grid.start, grid.goal):
+        return SearchResult("IDA*", [], UNREACHABLE, 1, 0.0, False, [grid.start])
 
+    rows, cols = grid.rows, grid.cols
+    adjacency, weights = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    h = grid.manhattan_to(grid.goal)
+    h_start = h[start]
+    bound = h_start
+    walls = grid.flat_weights()[0]
+    # Each new bound is at least ``step`` above the last. With fractional
+    # weights the next exceeded f-score is often only a hair higher, so
+    # plain IDA* would spend thousands of near-identical iterations; a wider
+    # window reaches the solving bound in far fewer passes, and the pass that
+    # finds the goal keeps searching below the best cost so far, so the
+    # result stays optimal. Without overshoot the first goal reached is
+    # already optimal and the pass stops there, as in plain IDA*.
+    step = min((w for w, wall in zip(weights, walls) if not wall), default=1.0)
+    visited_order: List[int] = [start]
+    explored = bytearray(rows * cols)
+    explored[start] = 1
 
-def ida_star_search(grid: Grid) -> SearchResult:
-    start, goal = grid.start, grid.goal
-    bound = _heuristic(start, goal)
-    visited_order: List[Position] = [start]
-    explored: Set[Position] = set([start])
-    final_path: List[Position] = []
+    # One depth-first pass bounded by ``limit``, run on an explicit stack so a
+    # single ``path``/``on_path`` pair is extended and unwound in place.
+    # Returns whether the goal was reached (``best_path`` then holds the
+    # cheapest route within the bound) and otherwise the smallest f-score
+    # that exceeded ``limit``.
+    path: List[int] = [start]
+    best_path: List[int] = []
+    on_path = bytearray(rows * cols)
 
-    def search(path: List[Position], g_cost: float, limit: float) -> float:
-        nonlocal final_path
-        node = path[-1]
-        f_score = g_cost + _heuristic(node, goal)
+    def search(limit: float, exhaustive: bool) -> Tuple[bool, float]:
+        path[:] = [start]
+        on_path[start] = 1
+        f_score = 0.0 + h_start
         if f_score > limit:
-            return f_score
-        if node == goal:
-            final_path = list(path)
-            return "FOUND"
-        minimum = inf
-        for neighbor in grid.neighbors(node):
-            if neighbor in path:
+            return False, f_score
+        if start == goal:
+            best_path[:] = path
+            return True, f_score
+        best_cost = inf
+        g_costs = [0.0]
+        pending = [list(adjacency[start])]
+        minima = [inf]
+        while pending:
+            neighbors = pending[-1]
+            if not neighbors:
+                pending.pop()
+                g_costs.pop()
+                on_path[path.pop()] = 0
+                minimum = minima.pop()
+                if not minima:
+                    return best_cost < inf, minimum
+                if minimum < minima[-1]:
+                    minima[-1] = minimum
+                continue
+            neighbor = neighbors.pop(0)
+            if on_path[neighbor]:
                 continue
             visited_order.append(neighbor)
-            explored.add(neighbor)
-            cost = g_cost + grid.cost(node, neighbor)
-            result = search(path + [neighbor], cost, limit)
-            if result == "FOUND":
-                return "FOUND"
-            if isinstance(result, float) and result < minimum:
-                minimum = result
-        return minimum
+            explored[neighbor] = 1
+            g_cost = g_costs[-1] + weights[neighbor]
+            f_score = g_cost + h[neighbor]
+            if f_score > limit:
+                if f_score < minima[-1]:
+                    minima[-1] = f_score
+                continue
+            if f_score >= best_cost:
+                continue
+            if neighbor == goal:
+                best_path[:] = path
+                best_path.append(goal)
+                best_cost = f_score
+                if not exhaustive:
+                    return True, f_score
+                continue
+            path.append(neighbor)
+            on_path[neighbor] = 1
+            g_costs.append(g_cost)
+            pending.append(list(adjacency[neighbor]))
+            minima.append(inf)
+        return False, inf
 
+    exhaustive = False
     while True:
-        t = search([start], 0.0, bound)
-        if t == "FOUND":
+        found, t = search(bound, exhaustive)
+        if found:
             success = True
             break
         if t == inf:
             success = False
             break
-        bound = t
+        exhaustive = t < bound + step
+        bound = max(t, bound + step)
 
-    cost = path_cost(grid, final_path) if success else float("inf")
+    final_path = NodeSequence(best_path, cols) if success else []
+    cost = path_cost(grid, final_path) if success else UNREACHABLE
     return SearchResult(
         name="IDA*",
-        path=final_path if success else [],
+        path=final_path,
         cost=cost,
-        explored_nodes=len(explored),
+        explored_nodes=explored.count(1),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
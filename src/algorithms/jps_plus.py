@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from typing import List, Optional
+
+from .base import UNREACHABLE, NodeSequence, SearchResult, path_cost
+from src.grid import Grid
+
+# Directions share the ``Grid.neighbors`` order: up, down, left, right.
+UP, DOWN, LEFT, RIGHT = range(4)
+JumpTable = List[List[int]]
+
+
+def _forced(walls: bytearray, rows: int, cols: int, cell: int, prev: int) -> bool:
+    # Arriving horizontally at ``cell`` from ``prev``, a vertical turn is only
+    # needed where the same turn from ``prev`` was blocked.
+    r = cell // cols
+    if r > 0 and not walls[cell - cols] and walls[prev - cols]:
+        return True
+    return r < rows - 1 and not walls[cell + cols] and walls[prev + cols]
+
+
+def precompute_jps(grid: Grid) -> JumpTable:
+    """Per-direction JPS+ jump distances for every cell of a 4-connected grid.
+
+    ``table[d][idx] > 0`` is the distance to the next jump point when moving
+    in direction ``d`` from ``idx``; ``<= 0`` is minus the number of open
+    cells before a wall. Paths are canonical with vertical moves first, so a
+    horizontal run only stops where a vertical turn is forced and a vertical
+    run stops where a horizontal run would reach a jump point. The table only
+    depends on obstacles and is cached on the grid.
+    """
+    return grid.derived("jps_plus", _build_jump_table, topology_only=True)
+
+
+def _build_jump_table(grid: Grid) -> JumpTable:
+    rows, cols = grid.rows, grid.cols
+    walls = grid.flat_weights()[0]
+    size = rows * cols
+    table = [[0] * size for _ in range(4)]
+    left, right = table[LEFT], table[RIGHT]
+    for r in range(rows):
+        first, last = r * cols, (r + 1) * cols - 1
+        for idx in range(last - 1, first - 1, -1):
+            nxt = idx + 1
+            if walls[nxt]:
+                continue
+            if _forced(walls, rows, cols, nxt, idx):
+                right[idx] = 1
+            else:
+                right[idx] = right[nxt] + 1 if right[nxt] > 0 else right[nxt] - 1
+        for idx in range(first + 1, last + 1):
+            nxt = idx - 1
+            if walls[nxt]:
+                continue
+            if _forced(walls, rows, cols, nxt, idx):
+                left[idx] = 1
+            else:
+                left[idx] = left[nxt] + 1 if left[nxt] > 0 else left[nxt] - 1
+
+    up, down = table[UP], table[DOWN]
+    branches = [left[idx] > 0 or right[idx] > 0 for idx in range(size)]
+    for c in range(cols):
+        for idx in range(size - cols + c - cols, -1, -cols):
+            nxt = idx + cols
+            if walls[nxt]:
+                continue
+            down[idx] = 1 if branches[nxt] else (down[nxt] + 1 if down[nxt] > 0 else down[nxt] - 1)
+        for idx in range(c + cols, size, cols):
+            nxt = idx - cols
+            if walls[nxt]:
+                continue
+            up[idx] = 1 if branches[nxt] else (up[nxt] + 1 if up[nxt] > 0 else up[nxt] - 1)
+    return table
+
+
+def _uniform_weight(grid: Grid) -> Optional[float]:
+    walls, weights = grid.flat_weights()
+    values = {w for w, wall in zip(weights, walls) if not wall}
+    if len(values) > 1:
+        return None
+    return values.pop() if values else 1.0
+
+
+def jps_plus_search(grid: Grid) -> SearchResult:
+    """A* over JPS+ jump points; only defined when every open cell costs the same.
+
+    On weighted grids the result is marked ``applicable=False`` rather than
+    standing in for another search.
+    """
+    weight = grid.derived("uniform_weight", _uniform_weight)
+    if weight is None:
+        return SearchResult("JPS+", [], UNREACHABLE, 0, 0.0, False, [], applicable=False)
+
+    rows, cols = grid.rows, grid.cols
+    walls = grid.flat_weights()[0]
+    table = precompute_jps(grid)
+    goal_r, goal_c = grid.goal
+    start = grid.start[0] * cols + grid.start[1]
+    goal = goal_r * cols + goal_c
+    steps = (-cols, cols, -1, 1)
+
+    # States are ``cell * 5 + incoming direction``; 4 marks the start, which
+    # may leave in every direction.
+    size = rows * cols * 5
+    g_costs = [UNREACHABLE] * size
+    parent = [-1] * size
+    closed = bytearray(size)
+    expanded = bytearray(rows * cols)
+    start_state = start * 5 + 4
+    g_costs[start_state] = 0.0
+    frontier = [(0.0, 0.0, start_state)]
+    visited_order = [start]
+    goal_state = -1
+
+    while frontier:
+        state = heappop(frontier)[2]
+        if closed[state]:
+            continue
+        closed[state] = 1
+        cell, incoming = divmod(state, 5)
+        expanded[cell] = 1
+        if cell == goal:
+            goal_state = state
+            break
+        if incoming == 4:
+            directions = (UP, DOWN, LEFT, RIGHT)
+        elif incoming <= DOWN:
+            directions = (incoming, LEFT, RIGHT)
+        else:
+            prev = cell - steps[incoming]
+            directions = [incoming]
+            r = cell // cols
+            if r > 0 and not walls[cell - cols] and walls[prev - cols]:
+                directions.append(UP)
+            if r < rows - 1 and not walls[cell + cols] and walls[prev + cols]:
+                directions.append(DOWN)
+
+        r, c = divmod(cell, cols)
+        for direction in directions:
+            jump = table[direction][cell]
+            reach = jump if jump > 0 else -jump
+            if direction <= DOWN:
+                offset = goal_r - r if direction == DOWN else r - goal_r
+            else:
+                offset = goal_c - c if direction == RIGHT else c - goal_c
+                if r != goal_r:
+                    offset = 0
+            if 0 < offset <= reach:
+                distance = offset
+            elif jump > 0:
+                distance = jump
+            else:
+                continue
+            target = cell + steps[direction] * distance
+            tentative_g = g_costs[state] + distance * weight
+            target_state = target * 5 + direction
+            if tentative_g < g_costs[target_state]:
+                g_costs[target_state] = tentative_g
+                parent[target_state] = state
+                tr, tc = divmod(target, cols)
+                f = tentative_g + (abs(tr - goal_r) + abs(tc - goal_c)) * weight
+                heappush(frontier, (f, -tentative_g, target_state))
+                visited_order.append(target)
+
+    success = goal_state != -1
+    path: List[int] = []
+    state = goal_state
+    while state != -1:
+        cell = state // 5
+        prev = parent[state]
+        if prev == -1:
+            path.append(cell)
+            break
+        step = steps[state % 5]
+        while cell != prev // 5:
+            path.append(cell)
+            cell -= step
+        state = prev
+    path.reverse()
+
+    result_path = NodeSequence(path, cols) if success else []
+    cost = path_cost(grid, result_path) if success else UNREACHABLE
+    return SearchResult(
+        name="JPS+",
+        path=result_path,
+        cost=cost,
+        explored_nodes=expanded.count(1),
+        duration=0.0,
+        success=success,
+        visited_order=NodeSequence(visited_order, cols),
+    )
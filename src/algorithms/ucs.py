@@ -1,46 +1,52 @@
 from __future__ import annotations
 
-import heapq
-from typing import Dict, Optional, Set
+from heapq import heappop, heappush
 
-from .base import SearchResult, path_cost, reconstruct_path
-from src.grid import Grid, Position
+from .base import (
+    UNREACHABLE,
+    NodeSequence,
+    SearchResult,
+    flat_search_state,
+    path_cost,
+    reconstruct_path,
+)
+from src.grid import Grid
 
 
 def uniform_cost_search(grid: Grid) -> SearchResult:
-    start = grid.start
-    goal = grid.goal
-    frontier: list[tuple[float, Position]] = [(0.0, start)]
-    costs: Dict[Position, float] = {start: 0.0}
-    parent: Dict[Position, Optional[Position]] = {start: None}
+    rows, cols = grid.rows, grid.cols
+    adjacency, weights = grid.precompute_adjacency()
+    start = grid.start[0] * cols + grid.start[1]
+    goal = grid.goal[0] * cols + grid.goal[1]
+    frontier: list[tuple[float, int]] = [(0.0, start)]
+    visited, costs, parent = flat_search_state(rows * cols)
+    costs[start] = 0.0
     visited_order = [start]
-    visited: Set[Position] = set()
 
     while frontier:
-        current_cost, current = heapq.heappop(frontier)
-        if current in visited:
+        current_cost, current = heappop(frontier)
+        if visited[current]:
             continue
-        visited.add(current)
+        visited[current] = 1
         if current == goal:
             break
-        for neighbor in grid.neighbors(current):
-            new_cost = current_cost + grid.cost(current, neighbor)
-            if neighbor not in costs or new_cost < costs[neighbor]:
+        for neighbor in adjacency[current]:
+            new_cost = current_cost + weights[neighbor]
+            if new_cost < costs[neighbor]:
                 costs[neighbor] = new_cost
                 parent[neighbor] = current
-                heapq.heappush(frontier, (new_cost, neighbor))
+                heappush(frontier, (new_cost, neighbor))
                 visited_order.append(neighbor)
 
-    success = goal in parent
-    path = reconstruct_path(parent, goal) if success else []
-    cost = path_cost(grid, path) if success else float("inf")
+    success = costs[goal] != UNREACHABLE
+    path = NodeSequence(reconstruct_path(parent, goal), cols) if success else []
+    cost = path_cost(grid, path) if success else UNREACHABLE
     return SearchResult(
         name="Uniform Cost",
         path=path,
         cost=cost,
-        explored_nodes=len(visited),
+        explored_nodes=visited.count(1),
         duration=0.0,
         success=success,
-        visited_order=visited_order,
+        visited_order=NodeSequence(visited_order, cols),
     )
-
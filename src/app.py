@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 import base64
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 import io
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
-from src.grid import Grid, Cell
+from src.grid import OPEN_CELL, Grid, Cell
 from src.evaluator import evaluate_algorithms, PRIORITY_CRITERIA, DEFAULT_PRIORITY_ORDER, select_best
 from src.presets import get_preset, list_presets
 from src.algorithms import SearchResult
@@ -28,11 +33,22 @@ except ImportError:  # pragma: no cover - optional dependency
 
 CANVAS_SIZE = 620
 DEFAULT_SPEED_MS = 120
+SUMMARY_DELAY_MS = 50
+ANIMATION_FRAME_MS = 33
+RUN_POLL_MS = 30
+RESULT_CACHE_SIZE = 32
+# Weighted cell fills: weights up to each bound take the matching colour,
+# anything heavier the last one.
+WEIGHT_BOUNDS = (1, 2, 3, 5)
+WEIGHT_FILLS = ("white", "#fed7aa", "#fdba74", "#fb923c", "#f97316")
+WALL_FILL = "#1f2937"
+START_FILL = "#16a34a"
+GOAL_FILL = "#dc2626"
 CAR_SPRITE_BASE64 = (
     "iVBORw0KGgoAAAANSUhEUgAAABAAAAAKCAYAAAC9vt6cAAAAJElEQVR4nGNgoAXgL8v7jw2TpYlow4aBAXKa1v9JwYPQAHIBAGFPnzGvz+hPAAAAAElFTkSuQmCC"
 )
 CAR_IMAGE_PATH = Path(__file__).resolve().parent.parent / "assets" / "car.png"
-ALGORITHM_OPTIONS = [
+ALGORITHM_OPTIONS = (
     "Auto (best)",
     "BFS",
     "DFS",
@@ -41,8 +57,42 @@ ALGORITHM_OPTIONS = [
     "A*",
     "IDA*",
     "Bidirectional",
-    "Bidirectional Astar"
-]
+    "Bidirectional Astar",
+    "JPS+",
+)
+COMPARE_ALGORITHM_OPTIONS = ALGORITHM_OPTIONS[1:]
+# Presets are built once at import, so their names never change
+PRESET_NAMES = list_presets()
+
+# Setup screen summary; only the values change between refreshes
+_SUMMARY_TEMPLATE = (
+    "=== Grid Configuration ===\n\n"
+    "{grid}\n\n"
+    "=== Algorithm ===\n\n"
+    "Selected: {algorithm}\n\n"
+    "=== Best Algorithm Priority ===\n\n"
+    "Best by: {priority}\n\n"
+    "=== Options ===\n\n"
+    "Show weights: {show_weights}"
+)
+_SUMMARY_GRID_TEMPLATE = (
+    "Grid Size: {rows} × {cols}\n"
+    "Start: {start}\n"
+    "Goal: {goal}\n"
+    "Obstacles: {obstacles}\n"
+    "Weighted cells: {weighted}\n"
+    "Source: {source}\n"
+    "Custom weights applied: {custom}"
+)
+_SUMMARY_PENDING_TEMPLATE = (
+    "No grid loaded yet.\n\n"
+    "Pending Settings:\n"
+    "  Rows: {rows}\n"
+    "  Cols: {cols}\n"
+    "  Obstacle ratio: {obstacle_ratio}\n"
+    "  Weight ratio: {weight_ratio}\n"
+    "Custom weights applied: {custom}"
+)
 
 # Priority criteria display names
 PRIORITY_DISPLAY_NAMES = {
@@ -59,11 +109,127 @@ def reorder_priority(order: List[str], from_index: int, to_index: int) -> List[s
         return current
     if not (0 <= from_index < len(current)) or not (0 <= to_index < len(current)):
         return current
+    if abs(from_index - to_index) == 1:
+        # Buttons and drag steps move one slot at a time: a plain swap.
+        current[from_index], current[to_index] = current[to_index], current[from_index]
+        return current
     item = current.pop(from_index)
     current.insert(to_index, item)
     return current
 
 
+@lru_cache(maxsize=16)
+def direction_for_step(dr: int, dc: int) -> str:
+    """Sprite heading for a move of ``dr`` rows and ``dc`` columns."""
+    if abs(dr) > abs(dc):
+        return "down" if dr > 0 else "up"
+    return "left" if dc < 0 else "right"
+
+
+@lru_cache(maxsize=4)
+def render_analytics_png(
+    names: Tuple[str, ...],
+    durations_ms: Tuple[float, ...],
+    costs: Tuple[float, ...],
+    nodes: Tuple[int, ...],
+) -> bytes:
+    """Render the analytics bar charts to PNG bytes.
+
+    The charts are static, so they are drawn off-screen with Agg and shown as
+    a plain image; reopening the overlay for the same results reuses the PNG.
+    """
+    figure = Figure(figsize=(7.2, 8), dpi=100)
+    # The charts share the algorithm axis, so only the bottom one labels it;
+    # fixed margins avoid the extra layout pass ``tight_layout`` needs.
+    axes = figure.subplots(3, 1, sharex=True)
+    figure.subplots_adjust(hspace=0.3, top=0.96, bottom=0.14, left=0.1, right=0.97)
+    charts = [
+        (axes[0], durations_ms, "Time Taken", "Milliseconds"),
+        (axes[1], costs, "Path Cost", "Cost"),
+        (axes[2], nodes, "Nodes Explored", "Nodes"),
+    ]
+    for ax, values, title, ylabel in charts:
+        ax.bar(names, values, color="#2563eb")
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+        ax.grid(axis="y", linestyle="--", alpha=0.3)
+    axes[-1].tick_params(axis="x", rotation=25)
+    for label in axes[-1].get_xticklabels():
+        label.set_horizontalalignment("right")
+        label.set_rotation_mode("anchor")
+    buffer = io.BytesIO()
+    FigureCanvasAgg(figure).print_png(buffer)
+    return buffer.getvalue()
+
+
+def format_result_details(result: SearchResult) -> str:
+    """Info panel text for a visualized result, including its full path and visit order."""
+    path_detail = ""
+    if result.path:
+        path_coords = " → ".join([f"({r},{c})" for r, c in result.path])
+        path_detail = f"Complete Path:\n{path_coords}\n"
+    explored_detail = ""
+    if result.visited_order:
+        explored_coords = " → ".join([f"({r},{c})" for r, c in result.visited_order])
+        explored_detail = f"\nExplored Nodes ({len(result.visited_order)}):\n{explored_coords}\n"
+    return (
+        f"Algorithm: {result.name}\n"
+        f"Cost: {result.cost:.3f} | Nodes explored: {result.explored_nodes} | Time: {result.duration:.4f}s\n"
+        f"Path length: {len(result.path) if result.path else 0}\n"
+        f"{path_detail}"
+        f"{explored_detail}"
+    )
+
+
+def format_results_list(results: List[SearchResult]) -> str:
+    """One line per result, cheapest first."""
+    lines: List[str] = []
+    for res in sorted(results, key=attrgetter("cost")):
+        if not res.applicable:
+            lines.append(f"{res.name}: not applicable to this grid")
+            continue
+        status = "OK" if res.success else "Fail"
+        lines.append(
+            f"{res.name}: cost={res.cost:.3f}, nodes={res.explored_nodes}, "
+            f"time={res.duration:.4f}s, {status}"
+        )
+    return "\n".join(lines)
+
+
+def set_readonly_text(widget: tk.Text, content: str) -> None:
+    """Replace the contents of a disabled ``Text`` widget with one insert."""
+    widget.configure(state="normal")
+    widget.delete("1.0", tk.END)
+    widget.insert("1.0", content)
+    widget.configure(state="disabled")
+
+
+def bind_wheel_scroll(canvas: tk.Canvas) -> None:
+    """Scroll ``canvas`` with the mouse wheel when the event comes from inside it.
+
+    Wheel events are bound application-wide, so each scroll area only reacts
+    to events from its own widgets; this lets the setup and visualization
+    panels share the binding instead of the last ``bind_all`` winning. X11
+    reports the wheel as buttons 4 and 5 rather than ``<MouseWheel>``.
+    """
+    prefix = str(canvas)
+    prefix_child = prefix + "."
+
+    def _scroll(event, units: int) -> None:
+        path = str(event.widget)
+        if units and (path == prefix or path.startswith(prefix_child)):
+            canvas.yview_scroll(units, "units")
+
+    def _on_wheel(event) -> None:
+        # Truncate toward zero like int(-delta / 120), in integer arithmetic.
+        delta = event.delta
+        _scroll(event, -delta // 120 if delta < 0 else -(delta // 120))
+
+    canvas.bind_all("<MouseWheel>", _on_wheel, add="+")
+    canvas.bind_all("<Button-4>", lambda event: _scroll(event, -1), add="+")
+    canvas.bind_all("<Button-5>", lambda event: _scroll(event, 1), add="+")
+
+
 class RankOrderControl(tk.Frame):
     """Drag-to-reorder widget for ranking algorithm priority criteria."""
 
@@ -85,39 +251,31 @@ class RankOrderControl(tk.Frame):
         incoming_order = order or [key for key, _ in items]
         self.order: List[str] = self._normalize_order(incoming_order)
         self.row_widgets: Dict[str, tk.Frame] = {}
+        self.row_parts: Dict[str, Dict[str, Any]] = {}
+        self._packed_order: List[str] = []
         self.drag_key: Optional[str] = None
         self._target_index: Optional[int] = None
+        self._pending_motion: Optional[int] = None
+        self._motion_job: Optional[str] = None
+        self._slot_midpoints: List[float] = []
 
         self.rows_frame = tk.Frame(self, bg=self.ROW_BG)
         self.rows_frame.pack(fill=tk.X, expand=True)
 
+        self._build_rows()
         self._render_rows()
 
     def _normalize_order(self, incoming: List[str]) -> List[str]:
-        normalized: List[str] = []
-        for key in incoming:
-            if key in self.items_by_key and key not in normalized:
-                normalized.append(key)
-        for key in self.items_by_key.keys():
-            if key not in normalized:
-                normalized.append(key)
-        return normalized
+        # Ordered dict keys dedupe in O(1); updating with every known key
+        # appends the missing ones without moving those already placed.
+        normalized = dict.fromkeys(key for key in incoming if key in self.items_by_key)
+        normalized.update(dict.fromkeys(self.items_by_key))
+        return list(normalized)
 
-    def _render_rows(self) -> None:
-        for child in self.rows_frame.winfo_children():
-            child.destroy()
-        self.row_widgets.clear()
-        for idx, key in enumerate(self.order):
-            row_bg = self.DRAG_BG if key == self.drag_key else self.ROW_BG
-            row = tk.Frame(
-                self.rows_frame,
-                bg=row_bg,
-                padx=6,
-                pady=6,
-                highlightthickness=2 if self._target_index == idx else 1,
-                highlightbackground=self.TARGET_BORDER if self._target_index == idx else self.IDLE_BORDER,
-            )
-            row.pack(fill=tk.X, pady=3)
+    def _build_rows(self) -> None:
+        """Create the widgets for every criterion once; ``_render_rows`` restyles them."""
+        for key in self.order:
+            row = tk.Frame(self.rows_frame, padx=6, pady=6)
             self.row_widgets[key] = row
 
             handle = tk.Label(
@@ -126,48 +284,79 @@ class RankOrderControl(tk.Frame):
                 font=("Arial", 14),
                 width=2,
                 cursor="fleur",
-                bg=row_bg,
             )
             handle.pack(side=tk.LEFT, padx=(0, 8))
             handle.bind("<ButtonPress-1>", lambda e, k=key: self._on_drag_start(k))
             handle.bind("<B1-Motion>", self._on_drag_motion)
             handle.bind("<ButtonRelease-1>", self._on_drag_release)
 
-            info_frame = tk.Frame(row, bg=row_bg)
+            info_frame = tk.Frame(row)
             info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            tk.Label(
+            name_label = tk.Label(
                 info_frame,
                 text=self.items_by_key[key],
                 font=("Arial", 11, "bold"),
-                bg=row_bg,
-            ).pack(anchor="w")
-            tk.Label(
+            )
+            name_label.pack(anchor="w")
+            rank_label = tk.Label(
                 info_frame,
-                text=f"Rank {idx + 1}",
                 font=("Arial", 9),
                 fg="#4b5563",
-                bg=row_bg,
-            ).pack(anchor="w")
+            )
+            rank_label.pack(anchor="w")
 
-            button_frame = tk.Frame(row, bg=row_bg)
+            button_frame = tk.Frame(row)
             button_frame.pack(side=tk.RIGHT, padx=(8, 0))
             btn_up = tk.Button(
                 button_frame,
                 text="Move up",
                 width=7,
-                state=tk.NORMAL if idx > 0 else tk.DISABLED,
-                command=lambda i=idx: self._manual_move(i, i - 1),
+                command=lambda k=key: self._move_by(k, -1),
             )
             btn_up.pack(anchor="e", pady=1)
             btn_down = tk.Button(
                 button_frame,
                 text="Move down",
                 width=7,
-                state=tk.NORMAL if idx < len(self.order) - 1 else tk.DISABLED,
-                command=lambda i=idx: self._manual_move(i, i + 1),
+                command=lambda k=key: self._move_by(k, 1),
             )
             btn_down.pack(anchor="e", pady=1)
 
+            self.row_parts[key] = {
+                "backgrounds": [row, handle, info_frame, name_label, rank_label, button_frame],
+                "rank_label": rank_label,
+                "up": btn_up,
+                "down": btn_down,
+            }
+
+    def _render_rows(self) -> None:
+        """Bring the existing rows in line with ``order`` and the drag state.
+
+        Rows are only repacked when the order changed, and each row's last
+        applied background, rank and target state are remembered in
+        ``row_parts`` so only widgets whose look changes are reconfigured.
+        """
+        if self._packed_order != self.order:
+            for key in self.order:
+                self.row_widgets[key].pack_forget()
+            for key in self.order:
+                self.row_widgets[key].pack(fill=tk.X, pady=3)
+            self._packed_order = list(self.order)
+        last = len(self.order) - 1
+        for idx, key in enumerate(self.order):
+            parts = self.row_parts[key]
+            row_bg = self.DRAG_BG if key == self.drag_key else self.ROW_BG
+            if parts.get("bg") != row_bg:
+                for widget in parts["backgrounds"]:
+                    widget.configure(bg=row_bg)
+                parts["bg"] = row_bg
+            if parts.get("index") != idx:
+                parts["rank_label"].configure(text=f"Rank {idx + 1}")
+                parts["up"].configure(state=tk.NORMAL if idx > 0 else tk.DISABLED)
+                parts["down"].configure(state=tk.NORMAL if idx < last else tk.DISABLED)
+                parts["index"] = idx
+        self._update_row_highlights()
+
     def _manual_move(self, from_index: int, to_index: int) -> None:
         self._target_index = None
         new_order = reorder_priority(self.order, from_index, to_index)
@@ -178,15 +367,37 @@ class RankOrderControl(tk.Frame):
         self._render_rows()
         self._emit_change()
 
+    def _move_by(self, key: str, offset: int) -> None:
+        index = self.order.index(key)
+        self._manual_move(index, index + offset)
+
     def _on_drag_start(self, key: str) -> None:
         self.drag_key = key
         self._render_rows()
+        # Rows share one height, so slot midpoints stay valid while rows
+        # swap places during the drag; measure them once here. The rows are
+        # already laid out (one is under the pointer) and restyling does not
+        # resize them, so no forced relayout is needed first.
+        self._slot_midpoints = [
+            row.winfo_rooty() + row.winfo_height() / 2
+            for row in (self.row_widgets[k] for k in self.order)
+        ]
 
     def _on_drag_motion(self, event) -> None:
+        # Motion events arrive far faster than rows need re-laying out; keep
+        # only the latest pointer position and handle it once per idle cycle.
         if not self.drag_key:
             return
-        self.update_idletasks()
-        pointer_y = event.y_root
+        self._pending_motion = event.y_root
+        if self._motion_job is None:
+            self._motion_job = self.after_idle(self._flush_motion)
+
+    def _flush_motion(self) -> None:
+        self._motion_job = None
+        pointer_y = self._pending_motion
+        self._pending_motion = None
+        if not self.drag_key or pointer_y is None:
+            return
         target_index = self._index_at_pointer(pointer_y)
         if target_index is None:
             return
@@ -201,33 +412,32 @@ class RankOrderControl(tk.Frame):
     def _on_drag_release(self, event) -> None:
         if not self.drag_key:
             return
+        if self._motion_job is not None:
+            self.after_cancel(self._motion_job)
+            self._flush_motion()
         self.drag_key = None
         self._target_index = None
         self._render_rows()
         self._emit_change()
 
     def _index_at_pointer(self, pointer_y: int) -> Optional[int]:
-        indices = list(range(len(self.order)))
-        for idx in indices:
-            key = self.order[idx]
-            row = self.row_widgets.get(key)
-            if not row:
-                continue
-            top = row.winfo_rooty()
-            bottom = top + row.winfo_height()
-            midpoint = top + (bottom - top) / 2
-            if pointer_y < midpoint:
-                return idx
-        return indices[-1] if indices else None
+        if not self._slot_midpoints:
+            return None
+        index = bisect_right(self._slot_midpoints, pointer_y)
+        return min(index, len(self._slot_midpoints) - 1)
 
     def _update_row_highlights(self) -> None:
         for idx, key in enumerate(self.order):
             row = self.row_widgets.get(key)
             if not row:
                 continue
+            is_target = self._target_index == idx
+            if self.row_parts[key].get("target") == is_target:
+                continue
+            self.row_parts[key]["target"] = is_target
             row.configure(
-                highlightthickness=2 if self._target_index == idx else 1,
-                highlightbackground=self.TARGET_BORDER if self._target_index == idx else self.IDLE_BORDER,
+                highlightthickness=2 if is_target else 1,
+                highlightbackground=self.TARGET_BORDER if is_target else self.IDLE_BORDER,
             )
 
     def _emit_change(self) -> None:
@@ -254,7 +464,7 @@ class SetupFrame(tk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.analytics_window: Optional[tk.Toplevel] = None
-        self._analytics_canvas: Optional[FigureCanvasTkAgg] = None
+        self._analytics_photo: Optional[tk.PhotoImage] = None
         self._build_ui()
     
     def _build_ui(self) -> None:
@@ -298,10 +508,7 @@ class SetupFrame(tk.Frame):
             config_canvas.configure(scrollregion=config_canvas.bbox("all"))
         
         config_frame.bind("<Configure>", _on_config_configure)
-        config_canvas.bind_all(
-            "<MouseWheel>",
-            lambda e: config_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"),
-        )
+        bind_wheel_scroll(config_canvas)
         
         # Preset selection
         tk.Label(config_frame, text="Preset Grid", font=("Arial", 10, "bold")).pack(anchor="w")
@@ -310,7 +517,7 @@ class SetupFrame(tk.Frame):
         self.preset_combo = ttk.Combobox(
             preset_frame, 
             textvariable=self.controller.preset_var, 
-            values=list_presets(), 
+            values=PRESET_NAMES, 
             state="readonly", 
             width=18
         )
@@ -429,13 +636,19 @@ class SetupFrame(tk.Frame):
         self.summary_text = tk.Text(summary_frame, height=15, width=35, state="disabled", wrap="word")
         self.summary_text.pack(fill=tk.BOTH, expand=True)
         
-        # Update summary when values change
-        self.controller.preset_var.trace_add("write", lambda *_: self._update_summary())
-        self.controller.rows_var.trace_add("write", lambda *_: self._update_summary())
-        self.controller.cols_var.trace_add("write", lambda *_: self._update_summary())
-        self.controller.obstacle_var.trace_add("write", lambda *_: self._update_summary())
-        self.controller.weight_var.trace_add("write", lambda *_: self._update_summary())
-        self.controller.algorithm_var.trace_add("write", lambda *_: self._update_summary())
+        # Update summary when values change (coalesced while the user types)
+        self._summary_job: Optional[str] = None
+        self._summary_shown = ""
+        controller = self.controller
+        for var in (
+            controller.preset_var,
+            controller.rows_var,
+            controller.cols_var,
+            controller.obstacle_var,
+            controller.weight_var,
+            controller.algorithm_var,
+        ):
+            var.trace_add("write", self._schedule_summary)
         
         # Initial summary
         self._update_summary()
@@ -473,47 +686,48 @@ class SetupFrame(tk.Frame):
         except Exception:
             pass  # Error already shown by build_grid
     
+    def _schedule_summary(self, *_trace_args: object) -> None:
+        """Refresh the summary once edits pause; several changes share one refresh."""
+        if self._summary_job is None:
+            self._summary_job = self.after(SUMMARY_DELAY_MS, self._update_summary)
+
     def _update_summary(self) -> None:
         """Update the summary panel with current configuration."""
-        grid = self.controller.current_grid
-        
-        lines = []
-        lines.append("=== Grid Configuration ===\n")
-        
+        if self._summary_job is not None:
+            self.after_cancel(self._summary_job)
+            self._summary_job = None
+        controller = self.controller
+        grid = controller.current_grid
+        custom = "Yes" if controller.has_custom_weights() else "No"
         if grid:
-            lines.append(f"Grid Size: {grid.rows} × {grid.cols}")
-            lines.append(f"Start: {grid.start}")
-            lines.append(f"Goal: {grid.goal}")
-            
-            # Count obstacles and weighted cells
-            obstacles = sum(1 for cell in grid.cells.values() if cell.obstacle)
-            weighted = sum(1 for cell in grid.cells.values() if cell.weight > 1)
-            lines.append(f"Obstacles: {obstacles}")
-            lines.append(f"Weighted cells: {weighted}")
-            lines.append(f"Source: {self.controller.grid_source or 'Not set'}")
-            lines.append(f"Custom weights applied: {'Yes' if self.controller.has_custom_weights() else 'No'}")
+            grid_section = _SUMMARY_GRID_TEMPLATE.format_map({
+                "rows": grid.rows,
+                "cols": grid.cols,
+                "start": grid.start,
+                "goal": grid.goal,
+                "obstacles": grid.obstacle_count,
+                "weighted": grid.weighted_count,
+                "source": controller.grid_source or "Not set",
+                "custom": custom,
+            })
         else:
-            lines.append("No grid loaded yet.")
-            lines.append(f"\nPending Settings:")
-            lines.append(f"  Rows: {self.controller.rows_var.get()}")
-            lines.append(f"  Cols: {self.controller.cols_var.get()}")
-            lines.append(f"  Obstacle ratio: {self.controller.obstacle_var.get()}")
-            lines.append(f"  Weight ratio: {self.controller.weight_var.get()}")
-            lines.append(f"Custom weights applied: {'Yes' if self.controller.has_custom_weights() else 'No'}")
-        
-        lines.append(f"\n=== Algorithm ===\n")
-        lines.append(f"Selected: {self.controller.algorithm_var.get()}")
-        
-        lines.append(f"\n=== Best Algorithm Priority ===\n")
-        lines.append(f"Best by: {self.controller.get_priority_display_string()}")
-        
-        lines.append(f"\n=== Options ===\n")
-        lines.append(f"Show weights: {'Yes' if self.controller.show_weights_var.get() else 'No'}")
-        
-        self.summary_text.configure(state="normal")
-        self.summary_text.delete("1.0", tk.END)
-        self.summary_text.insert(tk.END, "\n".join(lines))
-        self.summary_text.configure(state="disabled")
+            grid_section = _SUMMARY_PENDING_TEMPLATE.format_map({
+                "rows": controller.rows_var.get(),
+                "cols": controller.cols_var.get(),
+                "obstacle_ratio": controller.obstacle_var.get(),
+                "weight_ratio": controller.weight_var.get(),
+                "custom": custom,
+            })
+        text = _SUMMARY_TEMPLATE.format_map({
+            "grid": grid_section,
+            "algorithm": controller.algorithm_var.get(),
+            "priority": controller.get_priority_display_string(),
+            "show_weights": "Yes" if controller.show_weights_var.get() else "No",
+        })
+        if text == self._summary_shown:
+            return
+        self._summary_shown = text
+        set_readonly_text(self.summary_text, text)
 
     def update_start_button_state(self) -> None:
         """Enable or disable the start button depending on grid availability."""
@@ -551,6 +765,7 @@ class VisualizationFrame(tk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.analytics_window: Optional[tk.Toplevel] = None
+        self._analytics_photo: Optional[tk.PhotoImage] = None
         self._build_ui()
     
     def _build_ui(self) -> None:
@@ -583,7 +798,7 @@ class VisualizationFrame(tk.Frame):
             control_canvas.configure(scrollregion=control_canvas.bbox("all"))
         
         self.control_frame.bind("<Configure>", _on_control_configure)
-        control_canvas.bind_all("<MouseWheel>", lambda e: control_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        bind_wheel_scroll(control_canvas)
         
         # === Navigation ===
         nav_frame = tk.Frame(self.control_frame)
@@ -691,11 +906,11 @@ class VisualizationFrame(tk.Frame):
         compare_row = tk.Frame(compare_frame)
         compare_row.pack(fill=tk.X)
         tk.Label(compare_row, text="Compare:").pack(side=tk.LEFT)
-        self.compare_algo1 = ttk.Combobox(compare_row, values=ALGORITHM_OPTIONS[1:], state="readonly", width=12)
+        self.compare_algo1 = ttk.Combobox(compare_row, values=COMPARE_ALGORITHM_OPTIONS, state="readonly", width=12)
         self.compare_algo1.pack(side=tk.LEFT, padx=2)
         self.compare_algo1.set("A*")
         tk.Label(compare_row, text="vs").pack(side=tk.LEFT, padx=2)
-        self.compare_algo2 = ttk.Combobox(compare_row, values=ALGORITHM_OPTIONS[1:], state="readonly", width=12)
+        self.compare_algo2 = ttk.Combobox(compare_row, values=COMPARE_ALGORITHM_OPTIONS, state="readonly", width=12)
         self.compare_algo2.pack(side=tk.LEFT, padx=2)
         self.compare_algo2.set("BFS")
         
@@ -719,6 +934,7 @@ class VisualizationFrame(tk.Frame):
         tk.Label(results_frame, text="All Results:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(10, 0))
         self.results_box = tk.Text(results_frame, height=12, width=38, state="disabled", wrap="word")
         self.results_box.pack(anchor="w")
+        self.results_box_text = ""
         
         self.analytics_button = tk.Button(
             results_frame,
@@ -733,9 +949,8 @@ class VisualizationFrame(tk.Frame):
         self.analytics_button.pack(fill=tk.X, pady=(10, 0))
     
     def _on_show_weights_changed(self) -> None:
-        """Redraw grid when show weights changes."""
-        if self.controller.current_grid:
-            self.controller.draw_grid(self.controller.current_grid)
+        """Show or hide weight labels when the checkbox changes."""
+        self.controller.show_weight_labels(bool(self.controller.show_weights_var.get()))
     
     def _run_comparison(self) -> None:
         """Run comparison between two selected algorithms."""
@@ -751,31 +966,34 @@ class VisualizationFrame(tk.Frame):
             return
         
         # Find results for both algorithms
-        result1 = next((r for r in self.controller.results if r.name == algo1), None)
-        result2 = next((r for r in self.controller.results if r.name == algo2), None)
+        result1 = self.controller.results_by_name.get(algo1)
+        result2 = self.controller.results_by_name.get(algo2)
         
         if not result1 or not result2:
             messagebox.showinfo("Run First", "Please run the simulation first to get algorithm results.")
             return
+        for result in (result1, result2):
+            if not result.applicable:
+                messagebox.showinfo("Not Applicable", f"{result.name} does not apply to this grid.")
+                return
         
-        # Build comparison text
-        comparison = f"=== {algo1} vs {algo2} ===\n\n"
-        comparison += f"{'Metric':<15} {algo1:<15} {algo2:<15} Winner\n"
-        comparison += "-" * 55 + "\n"
-        
-        # Cost
-        cost_winner = algo1 if result1.cost < result2.cost else algo2 if result2.cost < result1.cost else "Tie"
-        comparison += f"{'Cost':<15} {result1.cost:<15.3f} {result2.cost:<15.3f} {cost_winner}\n"
-        
-        # Nodes
-        nodes_winner = algo1 if result1.explored_nodes < result2.explored_nodes else algo2 if result2.explored_nodes < result1.explored_nodes else "Tie"
-        comparison += f"{'Nodes':<15} {result1.explored_nodes:<15} {result2.explored_nodes:<15} {nodes_winner}\n"
-        
-        # Time
-        time_winner = algo1 if result1.duration < result2.duration else algo2 if result2.duration < result1.duration else "Tie"
-        comparison += f"{'Time (s)':<15} {result1.duration:<15.4f} {result2.duration:<15.4f} {time_winner}\n"
-        
-        self.compare_result_var.set(comparison)
+        # Metric rows: label, the two values and their format spec
+        metrics = (
+            ("Cost", result1.cost, result2.cost, ".3f"),
+            ("Nodes", result1.explored_nodes, result2.explored_nodes, ""),
+            ("Time (s)", result1.duration, result2.duration, ".4f"),
+        )
+        lines = [
+            f"=== {algo1} vs {algo2} ===",
+            "",
+            f"{'Metric':<15} {algo1:<15} {algo2:<15} Winner",
+            "-" * 55,
+        ]
+        for label, value1, value2, spec in metrics:
+            winner = algo1 if value1 < value2 else algo2 if value2 < value1 else "Tie"
+            lines.append(f"{label:<15} {value1:<15{spec}} {value2:<15{spec}} {winner}")
+        lines.append("")
+        self.compare_result_var.set("\n".join(lines))
     
     def on_show(self) -> None:
         """Called when this screen is shown."""
@@ -783,11 +1001,13 @@ class VisualizationFrame(tk.Frame):
             self.controller.draw_grid(self.controller.current_grid)
     
     def write_results_text(self, text: str) -> None:
-        """Update the results text box."""
-        self.results_box.configure(state="normal")
-        self.results_box.delete("1.0", tk.END)
-        self.results_box.insert(tk.END, text)
-        self.results_box.configure(state="disabled")
+        """Update the results text box, unless it already shows ``text``."""
+        # A priority change re-renders the same list; the widget rewrite is
+        # the costly part, so skip it.
+        if text == self.results_box_text:
+            return
+        set_readonly_text(self.results_box, text)
+        self.results_box_text = text
     
     def update_analytics_button_state(self, enabled: bool) -> None:
         """Enable or disable the Show Analytics button."""
@@ -809,18 +1029,21 @@ class VisualizationFrame(tk.Frame):
             return
         
         successful = [r for r in self.controller.results if r.success]
-        failed = [r for r in self.controller.results if not r.success]
+        failed = [r for r in self.controller.results if r.applicable and not r.success]
+        skipped = [r for r in self.controller.results if not r.applicable]
         overlay = tk.Toplevel(self)
         overlay.title("Algorithm Analytics")
         overlay.transient(self.controller.root)
         overlay.grab_set()
         overlay.resizable(False, False)
-        self.controller.root.update_idletasks()
         width, height = 780, 780
-        root_x = self.controller.root.winfo_rootx()
-        root_y = self.controller.root.winfo_rooty()
-        root_w = max(self.controller.root.winfo_width(), width)
-        root_h = max(self.controller.root.winfo_height(), height)
+        # The root has been mapped since start-up and its geometry is kept
+        # current by the event loop, so no idle flush is needed to read it.
+        root = self.controller.root
+        root_x = root.winfo_rootx()
+        root_y = root.winfo_rooty()
+        root_w = max(root.winfo_width(), width)
+        root_h = max(root.winfo_height(), height)
         x = root_x + (root_w - width) // 2
         y = root_y + (root_h - height) // 2
         overlay.geometry(f"{width}x{height}+{max(x, 0)}+{max(y, 0)}")
@@ -845,29 +1068,9 @@ class VisualizationFrame(tk.Frame):
         costs = [r.cost for r in successful]
         nodes = [r.explored_nodes for r in successful]
         
-        figure = Figure(figsize=(7.2, 8), dpi=100)
-        axes = [
-            figure.add_subplot(311),
-            figure.add_subplot(312),
-            figure.add_subplot(313),
-        ]
-        charts = [
-            (axes[0], durations_ms, "Time Taken", "Milliseconds"),
-            (axes[1], costs, "Path Cost", "Cost"),
-            (axes[2], nodes, "Nodes Explored", "Nodes"),
-        ]
-        for ax, values, title, ylabel in charts:
-            ax.bar(names, values, color="#2563eb")
-            ax.set_title(title)
-            ax.set_ylabel(ylabel)
-            ax.tick_params(axis="x", rotation=25)
-            ax.grid(axis="y", linestyle="--", alpha=0.3)
-        figure.tight_layout(pad=2.0)
-        
-        canvas = FigureCanvasTkAgg(figure, master=content)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self._analytics_canvas = canvas
+        png = render_analytics_png(tuple(names), tuple(durations_ms), tuple(costs), tuple(nodes))
+        self._analytics_photo = tk.PhotoImage(master=content, data=base64.b64encode(png))
+        tk.Label(content, image=self._analytics_photo).pack(fill=tk.BOTH, expand=True)
         
         if failed:
             fail_names = ", ".join(r.name for r in failed)
@@ -878,6 +1081,14 @@ class VisualizationFrame(tk.Frame):
                 anchor="w",
                 justify="left",
             ).pack(anchor="w", pady=(10, 0))
+        if skipped:
+            tk.Label(
+                content,
+                text=f"Not applicable to this grid: {', '.join(r.name for r in skipped)}",
+                fg="#475569",
+                anchor="w",
+                justify="left",
+            ).pack(anchor="w", pady=(4, 0))
         
         tk.Button(
             content,
@@ -894,7 +1105,7 @@ class VisualizationFrame(tk.Frame):
                 pass
             self.analytics_window.destroy()
         self.analytics_window = None
-        self._analytics_canvas = None
+        self._analytics_photo = None
 
 
 class SimulatorGUI:
@@ -908,7 +1119,7 @@ class SimulatorGUI:
         # === Shared State Variables ===
         
         # Configuration variables
-        self.preset_var = tk.StringVar(value=list_presets()[0])
+        self.preset_var = tk.StringVar(value=PRESET_NAMES[0])
         self.algorithm_var = tk.StringVar(value=ALGORITHM_OPTIONS[0])
         self.rows_var = tk.StringVar(value="12")
         self.cols_var = tk.StringVar(value="12")
@@ -940,25 +1151,54 @@ class SimulatorGUI:
         self.path_prev: Optional[Cell] = None
         self.cumulative_cost = 0.0
         self.path_taken: List[Tuple[int, int]] = []
+        self.path_text = ""  # path_taken as "(r,c) → (r,c)" text, extended one step at a time
         self.editing_weight = False
         self.weights_dirty = False
         self.last_painted_cell: Optional[Tuple[int, int]] = None
+        self._pending_drag_cells: List[Tuple[int, int]] = []  # cells dragged over since the last idle flush
+        self._drag_job: Optional[str] = None
         self.car_base_image: Optional["Image.Image"] = None
         self.car_direction_images: Dict[str, "Image.Image"] = {}
-        self.scaled_car_images: Dict[Tuple[str, int], tk.PhotoImage] = {}
+        self.car_sprites: Dict[str, tk.PhotoImage] = {}  # per heading, at the current cell size
         self.car_sprite_id: Optional[int] = None
         self.car_sprite_is_image = False
+        self.car_sprite_photo: Optional[tk.PhotoImage] = None  # image the sprite item shows
+        self.car_sprite_xy = (0.0, 0.0)  # centre of the cell the sprite was placed on
         self.car_anim_job: Optional[str] = None
         self.car_path: List[Tuple[int, int]] = []
         self.car_step_index = 0
         self.car_animating = False
         self.car_heading = "right"
         self.selected_cell: Optional[Tuple[int, int]] = None
+
+        # Canvas items, created once per grid shape and recoloured in place
+        self.canvas_layout: Optional[Tuple[int, int]] = None
+        self.cell_size = float(CANVAS_SIZE)  # pixel size of a cell in canvas_layout
+        self.cell_items: Dict[Tuple[int, int], int] = {}
+        self.cell_fills: Dict[Tuple[int, int], str] = {}
+        self.highlighted_cells: Set[Tuple[int, int]] = set()  # recoloured by animations since the last redraw
+        self.drawn_state: Optional[Tuple[Any, ...]] = None  # grid, edit version and endpoints of the last full pass
+        self.weight_items: Dict[Tuple[int, int], int] = {}
+        self.weight_labels: Dict[Tuple[int, int], str] = {}
         
         # Results
         self.results: List[SearchResult] = []
+        self.results_by_name: Dict[str, SearchResult] = {}
+        # Panel texts for the results, formatted on the worker thread
+        self.results_text = ""
+        self.result_details: Dict[str, str] = {}
         self.best_result: Optional[SearchResult] = None
         self.visualized_result: Optional[SearchResult] = None
+        # Results of earlier runs keyed by grid contents, most recent last
+        self._result_cache: "OrderedDict[Tuple[Any, ...], List[SearchResult]]" = OrderedDict()
+        # One long-lived thread runs the searches, one request at a time, and
+        # hands each outcome back as a (callback, args) message that the Tk
+        # thread drains on a poll timer while runs are outstanding.
+        self._run_requests: "queue.Queue[None]" = queue.Queue()
+        self._run_messages: "queue.Queue[Tuple[Callable[..., None], Tuple[Any, ...]]]" = queue.Queue()
+        self._runs_in_flight = 0
+        self._run_poll_job: Optional[str] = None
+        threading.Thread(target=self._run_worker, daemon=True).start()
         
         # === Container for screens ===
         self.container = tk.Frame(root)
@@ -967,7 +1207,6 @@ class SimulatorGUI:
         # Create screens
         self.setup_frame = SetupFrame(self.container, self)
         self.visualization_frame = VisualizationFrame(self.container, self)
-        self._load_car_sprite()
         
         # Initially show setup
         self.current_screen: Optional[tk.Frame] = None
@@ -1031,78 +1270,183 @@ class SimulatorGUI:
     # === Drawing ===
     
     def draw_grid(self, grid: Grid) -> None:
-        """Draw the grid on the visualization canvas."""
+        """Draw the grid on the visualization canvas.
+
+        Cell rectangles are created once per grid shape and then reused:
+        later calls only recolour cells whose fill changed, and skip the cells
+        entirely when the same grid is unchanged since the last full pass and
+        nothing is highlighted. Weight labels are created the first time they
+        are shown and hidden rather than deleted.
+        """
+        self._stop_car_animation()
         canvas = self.visualization_frame.grid_canvas
-        canvas.delete("all")
+        show_weights = bool(self.show_weights_var.get())
+        layout = (grid.rows, grid.cols)
+        if layout != self.canvas_layout:
+            self.cell_size = CANVAS_SIZE / max(layout)
+            self._create_cell_items(grid)
+            self._prepare_car_sprites(self.cell_size)
+            self.canvas_layout = layout
+        if show_weights and not self.weight_items:
+            self._create_weight_items(grid)
+            self.drawn_state = None
+        labels = bool(self.weight_items)
+        # The grid itself is part of the key, which also keeps it alive so a
+        # new grid can never match by a reused id.
+        state = (grid, grid.cells.version, grid.start, grid.goal)
+        if state != self.drawn_state or self.highlighted_cells:
+            # Colours come from the grid's flat wall/weight buffers, which are
+            # cached on the grid and shared with the searches.
+            fills = self._cell_colors(grid)
+            weights = grid.flat_weights()[1]
+            idx = 0
+            for r in range(grid.rows):
+                for c in range(grid.cols):
+                    self._set_cell_fill((r, c), fills[idx])
+                    if labels:
+                        self._set_weight_label((r, c), weights[idx])
+                    idx += 1
+            self.drawn_state = state
+        if labels:
+            canvas.itemconfigure("weight", state=tk.NORMAL if show_weights else tk.HIDDEN)
+        self.highlighted_cells.clear()
+
+    def clear_highlights(self) -> None:
+        """Restore only the cells animations recoloured since the last redraw.
+
+        Falls back to ``draw_grid`` when the canvas holds a different layout.
+        """
+        grid = self.current_grid
+        if grid is None:
+            return
+        if self.canvas_layout != (grid.rows, grid.cols):
+            self.draw_grid(grid)
+            return
         self._stop_car_animation()
-        matrix = grid.as_matrix()
-        cell_size = CANVAS_SIZE / max(grid.rows, grid.cols)
+        for pos in self.highlighted_cells:
+            self._redraw_cell(pos)
+        self.highlighted_cells.clear()
+
+    def show_weight_labels(self, visible: bool) -> None:
+        """Show or hide the weight labels without repainting cells.
+
+        Highlights and any running animation are left untouched; labels are
+        created the first time they are shown and hidden afterwards.
+        """
+        grid = self.current_grid
+        if grid is None or not self.cell_items:
+            return
+        canvas = self.visualization_frame.grid_canvas
+        if visible and not self.weight_items:
+            self._create_weight_items(grid)
+            weights = grid.flat_weights()[1]
+            for r, c in self.weight_items:
+                self._set_weight_label((r, c), weights[r * grid.cols + c])
+            if self.car_sprite_id is not None:
+                canvas.tag_raise(self.car_sprite_id)
+        if self.weight_items:
+            canvas.itemconfigure("weight", state=tk.NORMAL if visible else tk.HIDDEN)
+
+    def _cell_edges(self, grid: Grid) -> Tuple[List[float], List[float]]:
+        """Canvas x positions of the column edges and y positions of the row edges."""
+        cell_size = self.cell_size
+        return [c * cell_size for c in range(grid.cols + 1)], [r * cell_size for r in range(grid.rows + 1)]
+
+    def _create_cell_items(self, grid: Grid) -> None:
+        """Create one rectangle per cell, replacing everything on the canvas."""
+        canvas = self.visualization_frame.grid_canvas
+        canvas.delete("all")
+        self.drawn_state = None
+        self.cell_items = {}
+        self.cell_fills = {}
+        self.weight_items = {}
+        self.weight_labels = {}
+        xs, ys = self._cell_edges(grid)
         for r in range(grid.rows):
+            y1, y2 = ys[r], ys[r + 1]
             for c in range(grid.cols):
-                x1, y1 = c * cell_size, r * cell_size
-                x2, y2 = x1 + cell_size, y1 + cell_size
-                cell: Cell = matrix[r][c]
-                color = "white"
-                if cell.obstacle:
-                    color = "#1f2937"
-                elif (r, c) == grid.start:
-                    color = "#16a34a"
-                elif (r, c) == grid.goal:
-                    color = "#dc2626"
-                elif cell.weight > 1:
-                    if cell.weight <= 2:
-                        color = "#fed7aa"
-                    elif cell.weight <= 3:
-                        color = "#fdba74"
-                    elif cell.weight <= 5:
-                        color = "#fb923c"
-                    else:
-                        color = "#f97316"
-                canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#e5e7eb")
-                # Optionally show weight text
-                if self.show_weights_var.get():
-                    if cell.weight == 1.0:
-                        w_text = "1"
-                    elif cell.weight.is_integer():
-                        w_text = f"{int(cell.weight)}"
-                    else:
-                        w_text = f"{cell.weight:.1f}"
-                    canvas.create_text(
-                        (x1 + x2) / 2, (y1 + y2) / 2, 
-                        text=w_text, 
-                        fill="#000000", 
-                        font=("Arial", max(8, int(cell_size // 5)))
-                    )
-    
+                self.cell_items[(r, c)] = canvas.create_rectangle(
+                    xs[c], y1, xs[c + 1], y2, fill="white", outline="#e5e7eb"
+                )
+                self.cell_fills[(r, c)] = "white"
+
+    def _create_weight_items(self, grid: Grid) -> None:
+        """Create the (initially empty) weight label drawn over each cell."""
+        canvas = self.visualization_frame.grid_canvas
+        font = ("Arial", max(8, int(self.cell_size // 5)))
+        xs, ys = self._cell_edges(grid)
+        for r in range(grid.rows):
+            cy = (ys[r] + ys[r + 1]) / 2
+            for c in range(grid.cols):
+                self.weight_items[(r, c)] = canvas.create_text(
+                    (xs[c] + xs[c + 1]) / 2, cy,
+                    text="",
+                    fill="#000000",
+                    font=font,
+                    tags="weight",
+                )
+                self.weight_labels[(r, c)] = ""
+
+    @staticmethod
+    def _cell_color(grid: Grid, pos: Tuple[int, int], obstacle: bool, weight: float) -> str:
+        """Base fill colour of a cell before any animation."""
+        if obstacle:
+            return WALL_FILL
+        if pos == grid.start:
+            return START_FILL
+        if pos == grid.goal:
+            return GOAL_FILL
+        return WEIGHT_FILLS[bisect_left(WEIGHT_BOUNDS, weight)]
+
+    @staticmethod
+    def _cell_colors(grid: Grid) -> List[str]:
+        """Base fill of every cell, indexed by ``row * cols + col``."""
+        walls, weights = grid.flat_weights()
+        # Grids only use a handful of distinct weights: bucket each once.
+        palette = {w: WEIGHT_FILLS[bisect_left(WEIGHT_BOUNDS, w)] for w in set(weights)}
+        fills = [palette[w] for w in weights]
+        for pos, fill in ((grid.goal, GOAL_FILL), (grid.start, START_FILL)):
+            idx = pos[0] * grid.cols + pos[1]
+            if 0 <= idx < len(fills):
+                fills[idx] = fill
+        idx = walls.find(1)
+        while idx != -1:
+            fills[idx] = WALL_FILL
+            idx = walls.find(1, idx + 1)
+        return fills
+
+    def _set_cell_fill(self, pos: Tuple[int, int], color: str) -> None:
+        """Recolour an existing cell rectangle, skipping no-op updates."""
+        item = self.cell_items.get(pos)
+        if item is None or self.cell_fills.get(pos) == color:
+            return
+        self.visualization_frame.grid_canvas.itemconfig(item, fill=color)
+        self.cell_fills[pos] = color
+
+    def _set_weight_label(self, pos: Tuple[int, int], weight: float) -> None:
+        """Update a cell's weight label if weights are shown."""
+        item = self.weight_items.get(pos)
+        if item is None:
+            return
+        if weight == 1.0:
+            w_text = "1"
+        elif weight.is_integer():
+            w_text = f"{int(weight)}"
+        else:
+            w_text = f"{weight:.1f}"
+        if self.weight_labels.get(pos) != w_text:
+            self.visualization_frame.grid_canvas.itemconfig(item, text=w_text)
+            self.weight_labels[pos] = w_text
+
     def _highlight_cell(self, pos: Tuple[int, int], color: str) -> None:
         """Highlight a cell during animation."""
-        grid = self.current_grid
-        if grid is None:
+        if self.current_grid is None:
             return
-        canvas = self.visualization_frame.grid_canvas
-        cell_size = CANVAS_SIZE / max(grid.rows, grid.cols)
-        r, c = pos
-        x1, y1 = c * cell_size, r * cell_size
-        x2, y2 = x1 + cell_size, y1 + cell_size
-        canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#e5e7eb")
-        # If showing weights, redraw weight text on top
-        if self.show_weights_var.get():
-            cell = grid.cells.get(pos, Cell())
-            if cell.weight == 1.0:
-                w_text = "1"
-            elif cell.weight.is_integer():
-                w_text = f"{int(cell.weight)}"
-            else:
-                w_text = f"{cell.weight:.1f}"
-            canvas.create_text(
-                (x1 + x2) / 2, (y1 + y2) / 2, 
-                text=w_text, 
-                fill="#000000", 
-                font=("Arial", max(8, int(cell_size // 5)))
-            )
+        self._set_cell_fill(pos, color)
+        self.highlighted_cells.add(pos)
 
     def _load_car_sprite(self) -> None:
-        """Load or construct the car sprite image."""
+        """Load or construct the car sprite image on first use, then keep it."""
         if self.car_base_image is not None or Image is None:
             return
         if CAR_IMAGE_PATH.exists():
@@ -1117,68 +1461,42 @@ class SimulatorGUI:
             return
         except Exception:
             fallback = Image.new("RGBA", (32, 20), (0, 0, 0, 0))
-            for x in range(0, 32):
-                for y in range(12, 20):
-                    fallback.putpixel((x, y), (15, 23, 42, 255))
-            for x in range(2, 30):
-                for y in range(4, 12):
-                    fallback.putpixel((x, y), (15, 118, 110, 255))
-            for x in range(8, 24):
-                for y in range(4, 10):
-                    fallback.putpixel((x, y), (147, 197, 253, 255))
+            fallback.paste((15, 23, 42, 255), (0, 12, 32, 20))
+            fallback.paste((15, 118, 110, 255), (2, 4, 30, 12))
+            fallback.paste((147, 197, 253, 255), (8, 4, 24, 10))
             self.car_base_image = fallback
 
-    def _direction_for_step(self, start: Tuple[int, int], end: Tuple[int, int]) -> str:
-        dr = end[0] - start[0]
-        dc = end[1] - start[1]
-        if abs(dr) > abs(dc):
-            return "down" if dr > 0 else "up"
-        if dc > 0:
-            return "right"
-        elif dc < 0:
-            return "left"
-        return "right"
-
-    def _get_car_sprite_for_cell(self, cell_size: float, direction: str) -> Optional[tk.PhotoImage]:
-        """Return a scaled sprite for the specified direction."""
+    def _prepare_car_sprites(self, cell_size: float) -> None:
+        """Rotate and scale the car sprite for every heading at ``cell_size``."""
+        self.car_sprites = {}
         self._load_car_sprite()
         if Image is None or ImageTk is None or self.car_base_image is None:
-            return None
-        if direction not in self.car_direction_images:
-            angle_map = {
-                "right": 0,
-                "down": -90,
-                "left": 180,
-                "up": -270,
-            }
-            angle = angle_map.get(direction, 0)
-            self.car_direction_images[direction] = self.car_base_image.rotate(angle, expand=True)
-        base_image = self.car_direction_images[direction]
-        key = (direction, max(1, int(round(cell_size))))
-        if key in self.scaled_car_images:
-            return self.scaled_car_images[key]
+            return
         target = max(1, int(cell_size * 0.8))
-        width, height = base_image.size
-        if width <= target and height <= target:
-            photo = ImageTk.PhotoImage(base_image)
-        else:
-            scale = max(width / target, height / target)
-            new_size = (max(1, int(width / scale)), max(1, int(height / scale)))
-            resized = base_image.resize(new_size, Image.LANCZOS)
-            photo = ImageTk.PhotoImage(resized)
-        self.scaled_car_images[key] = photo
-        return photo
+        # A car icon this small looks the same under any filter; pick the cheap ones.
+        resample = Image.BILINEAR if target > 24 else Image.NEAREST
+        for direction, angle in (("right", 0), ("down", -90), ("left", 180), ("up", -270)):
+            base_image = self.car_direction_images.get(direction)
+            if base_image is None:
+                base_image = self.car_base_image.rotate(angle, expand=True)
+                self.car_direction_images[direction] = base_image
+            width, height = base_image.size
+            longest = max(width, height)
+            if longest > target:
+                new_size = (max(1, width * target // longest), max(1, height * target // longest))
+                base_image = base_image.resize(new_size, resample)
+            self.car_sprites[direction] = ImageTk.PhotoImage(base_image)
 
     def _place_car_sprite(self, pos: Tuple[int, int], direction: str) -> None:
         """Place or move the car sprite to the specified cell."""
         if self.current_grid is None:
             return
         canvas = self.visualization_frame.grid_canvas
-        cell_size = CANVAS_SIZE / max(self.current_grid.rows, self.current_grid.cols)
+        cell_size = self.cell_size
         r, c = pos
         cx = c * cell_size + cell_size / 2
         cy = r * cell_size + cell_size / 2
-        sprite = self._get_car_sprite_for_cell(cell_size, direction)
+        sprite = self.car_sprites.get(direction)
         if sprite is not None:
             if self.car_sprite_id is None or not self.car_sprite_is_image:
                 if self.car_sprite_id is not None:
@@ -1186,8 +1504,10 @@ class SimulatorGUI:
                 self.car_sprite_id = canvas.create_image(cx, cy, image=sprite)
                 self.car_sprite_is_image = True
             else:
-                canvas.coords(self.car_sprite_id, cx, cy)
-                canvas.itemconfig(self.car_sprite_id, image=sprite)
+                self._move_car_sprite(cx, cy)
+                if sprite is not self.car_sprite_photo:
+                    canvas.itemconfig(self.car_sprite_id, image=sprite)
+            self.car_sprite_photo = sprite
         else:
             if self.car_sprite_id is None or self.car_sprite_is_image:
                 if self.car_sprite_id is not None:
@@ -1202,7 +1522,18 @@ class SimulatorGUI:
                 )
                 self.car_sprite_is_image = False
             else:
-                canvas.coords(self.car_sprite_id, cx, cy)
+                self._move_car_sprite(cx, cy)
+        self.car_sprite_xy = (cx, cy)
+
+    def _move_car_sprite(self, cx: float, cy: float) -> None:
+        """Shift the sprite item from its last cell centre to ``(cx, cy)``.
+
+        A relative move works for both the image and the rectangle fallback,
+        whose coordinate lists differ in length.
+        """
+        x, y = self.car_sprite_xy
+        if cx != x or cy != y:
+            self.visualization_frame.grid_canvas.move(self.car_sprite_id, cx - x, cy - y)
 
     def _start_car_animation(self, path: List[Tuple[int, int]]) -> None:
         """Begin animating the car along the final path."""
@@ -1214,7 +1545,8 @@ class SimulatorGUI:
         self.car_step_index = 1  # start is already placed
         self.car_animating = True
         if len(path) >= 2:
-            self.car_heading = self._direction_for_step(path[0], path[1])
+            (r0, c0), (r1, c1) = path[0], path[1]
+            self.car_heading = direction_for_step(r1 - r0, c1 - c0)
         else:
             self.car_heading = "right"
         self.running = True
@@ -1239,7 +1571,7 @@ class SimulatorGUI:
             return
         prev = self.car_path[self.car_step_index - 1]
         pos = self.car_path[self.car_step_index]
-        self.car_heading = self._direction_for_step(prev, pos)
+        self.car_heading = direction_for_step(pos[0] - prev[0], pos[1] - prev[1])
         self._place_car_sprite(pos, self.car_heading)
         self.car_step_index += 1
         if self.car_step_index < len(self.car_path):
@@ -1268,6 +1600,7 @@ class SimulatorGUI:
             self.visualization_frame.grid_canvas.delete(self.car_sprite_id)
             self.car_sprite_id = None
             self.car_sprite_is_image = False
+            self.car_sprite_photo = None
 
     def _complete_run(self) -> None:
         """Mark the simulation run as completed."""
@@ -1288,8 +1621,7 @@ class SimulatorGUI:
         self.status_var.set("Running algorithms...")
         self.draw_grid(self.current_grid)
         
-        thread = threading.Thread(target=self._execute_algorithms, daemon=True)
-        thread.start()
+        self._queue_run()
     
     def rerun_simulation(self) -> None:
         """Re-run simulation on the same grid (for tinkering)."""
@@ -1305,34 +1637,97 @@ class SimulatorGUI:
         # Reset run state
         self._reset_run_state()
         
-        # Redraw grid (preserves edits)
-        self.draw_grid(self.current_grid)
+        # Undo the last run's highlights (edits are already on the canvas)
+        self.clear_highlights()
         
         # Run algorithms
         self.running = True
         self.paused = False
         self.status_var.set("Re-running algorithms...")
         
-        thread = threading.Thread(target=self._execute_algorithms, daemon=True)
-        thread.start()
+        self._queue_run()
     
+    def _queue_run(self) -> None:
+        """Ask the worker thread for a run and watch for its outcome."""
+        self._runs_in_flight += 1
+        self._run_requests.put(None)
+        if self._run_poll_job is None:
+            self._run_poll_job = self.root.after(RUN_POLL_MS, self._poll_run_messages)
+
+    def _run_worker(self) -> None:
+        """Serve queued run requests off the Tk thread for the app's lifetime."""
+        while True:
+            self._run_requests.get()
+            try:
+                self._execute_algorithms()
+            except Exception as e:  # keep serving later runs
+                self._run_messages.put((self._on_run_failed, (e,)))
+            else:
+                self._run_messages.put((self._after_algorithms, ()))
+
+    def _poll_run_messages(self) -> None:
+        """Handle every finished run, polling again while others are pending."""
+        self._run_poll_job = None
+        try:
+            while True:
+                try:
+                    callback, args = self._run_messages.get_nowait()
+                except queue.Empty:
+                    break
+                self._runs_in_flight -= 1
+                try:
+                    callback(*args)
+                except Exception:
+                    # One failing handler must not strand the messages
+                    # behind it or leave the run marked as in progress.
+                    self.running = False
+                    raise
+        finally:
+            if self._runs_in_flight or not self._run_messages.empty():
+                self._run_poll_job = self.root.after(RUN_POLL_MS, self._poll_run_messages)
+
+    def _on_run_failed(self, error: Exception) -> None:
+        """Report a run that raised on the worker thread."""
+        self.running = False
+        self.status_var.set("Run failed.")
+        messagebox.showerror("Error", f"Failed to run algorithms: {error}")
+
     def _execute_algorithms(self) -> None:
         """Execute algorithms in background thread."""
         grid = self.current_grid.clone() if self.current_grid else None
         if grid is None:
             return
         priority_order = self.get_priority_order()
-        results, best = evaluate_algorithms(grid, priority_order)
+        key = self._result_key(grid)
+        results = self._result_cache.get(key)
+        if results is None:
+            results, best = evaluate_algorithms(grid, priority_order)
+            self._result_cache[key] = results
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        else:
+            # Same walls, weights and endpoints: reuse the earlier run
+            self._result_cache.move_to_end(key)
+            best = select_best(results, priority_order)
+        # Format the panel texts here rather than in the Tk callback; the
+        # visit-order listing grows with the explored area.
+        self.result_details = {result.name: format_result_details(result) for result in results}
+        self.results_text = format_results_list(results)
+        self.results_by_name = {result.name: result for result in results}
         self.results = results
         self.best_result = best
-        self.root.after(0, self._after_algorithms)
     
+    @staticmethod
+    def _result_key(grid: Grid) -> Tuple[Any, ...]:
+        """Identify a grid by everything the searches read from it."""
+        walls, weights = grid.flat_weights()
+        return (grid.rows, grid.cols, grid.start, grid.goal, bytes(walls), tuple(weights))
+
     def set_priority_order(self, order: List[str]) -> None:
         """Persist a new priority order and refresh dependent UI."""
-        normalized: List[str] = [key for key in order if key in PRIORITY_CRITERIA]
-        for key in PRIORITY_CRITERIA:
-            if key not in normalized:
-                normalized.append(key)
+        # Known keys in the given order, each once, then any missing ones
+        normalized: List[str] = [key for key in dict.fromkeys(order) if key in PRIORITY_CRITERIA]
+        normalized.extend(key for key in PRIORITY_CRITERIA if key not in normalized)
         if normalized == self.priority_order:
             return
         self.priority_order = normalized
@@ -1362,7 +1757,7 @@ class SimulatorGUI:
     def _after_algorithms(self) -> None:
         """Handle algorithm completion."""
         if self.best_result is None or self.current_grid is None:
-            self.status_var.set("No solution found.")
+            self._set_var_text(self.status_var, "No solution found.")
             self.running = False
             return
         
@@ -1370,14 +1765,19 @@ class SimulatorGUI:
         selected_name = self.algorithm_var.get()
         if visualized is None or not visualized.success:
             if selected_name != "Auto (best)":
+                reason = (
+                    "does not apply to this grid"
+                    if visualized is not None and not visualized.applicable
+                    else "did not produce a valid path"
+                )
                 messagebox.showwarning(
                     "Selection unavailable",
-                    f"Algorithm '{selected_name}' did not produce a valid path. "
+                    f"Algorithm '{selected_name}' {reason}. "
                     "Falling back to the optimal result."
                 )
             visualized = self.best_result
         if visualized is None:
-            self.status_var.set("No solution found.")
+            self._set_var_text(self.status_var, "No solution found.")
             self.running = False
             return
 
@@ -1394,7 +1794,7 @@ class SimulatorGUI:
         selected = self.algorithm_var.get()
         if selected == "Auto (best)":
             return self.best_result
-        return next((r for r in self.results if r.name == selected), None)
+        return self.results_by_name.get(selected)
     
     # === Animation ===
     
@@ -1406,17 +1806,22 @@ class SimulatorGUI:
             return
         visited = self.visualized_result.visited_order
         if self.animation_index < len(visited):
-            pos = visited[self.animation_index]
-            self._highlight_cell(pos, "#3b82f6")
-            self.animation_index += 1
             delay = max(10, self.speed_var.get())
-            self.animation_job = self.root.after(delay, self.animate_exploration)
+            # Below one frame per cell, paint several cells per timer tick at
+            # the same cells-per-second rate so Tk redraws once per batch.
+            batch = max(1, ANIMATION_FRAME_MS // delay)
+            end = min(self.animation_index + batch, len(visited))
+            for index in range(self.animation_index, end):
+                self._highlight_cell(visited[index], "#3b82f6")
+            self.animation_index = end
+            self.animation_job = self.root.after(delay * batch, self.animate_exploration)
         else:
             # Start step-by-step path animation
             self.path_index = 0
             self.cumulative_cost = 0.0
             self.path_prev = None
             self.path_taken = []
+            self.path_text = ""
             self.animate_path()
     
     def animate_path(self) -> None:
@@ -1429,6 +1834,8 @@ class SimulatorGUI:
         if self.path_index < len(path):
             pos = path[self.path_index]
             self.path_taken.append(pos)
+            label = f"({pos[0]},{pos[1]})"
+            self.path_text = f"{self.path_text} → {label}" if self.path_text else label
             self._highlight_cell(pos, "#fde047")
             if self.path_prev is not None:
                 step_cost = self.current_grid.cost(self.path_prev, pos)
@@ -1436,8 +1843,7 @@ class SimulatorGUI:
             self.path_prev = pos
             
             # Build detailed path display
-            path_coords = " → ".join([f"({r},{c})" for r, c in self.path_taken])
-            path_progress = f"Step {self.path_index + 1}/{len(path)}: {pos}\nCost so far: {self.cumulative_cost:.3f}\n\nPath taken:\n{path_coords}"
+            path_progress = f"Step {self.path_index + 1}/{len(path)}: {pos}\nCost so far: {self.cumulative_cost:.3f}\n\nPath taken:\n{self.path_text}"
             
             info = (
                 f"Algorithm: {self.visualized_result.name}\n"
@@ -1452,13 +1858,12 @@ class SimulatorGUI:
         else:
             # Final cost compute
             total_cost = path_cost(self.current_grid, path) if path else 0.0
-            path_coords = " → ".join([f"({r},{c})" for r, c in self.path_taken])
             final_info = (
                 f"Algorithm: {self.visualized_result.name}\n"
                 f"Path Complete!\n"
                 f"Total steps: {len(path)}\n"
                 f"Total cost: {total_cost:.3f}\n\n"
-                f"Final path:\n{path_coords}"
+                f"Final path:\n{self.path_text}"
             )
             self.viz_info_var.set(final_info)
             self.status_var.set(f"Finished. Total cost: {total_cost:.3f}")
@@ -1482,7 +1887,7 @@ class SimulatorGUI:
         if self.car_anim_job:
             self.root.after_cancel(self.car_anim_job)
             self.car_anim_job = None
-        self.status_var.set("Paused")
+        self._set_var_text(self.status_var, "Paused")
     
     def resume_animation(self) -> None:
         """Resume a paused animation."""
@@ -1491,7 +1896,7 @@ class SimulatorGUI:
         if not self.paused:
             return
         self.paused = False
-        self.status_var.set("Resumed")
+        self._set_var_text(self.status_var, "Resumed")
         # Resume at the correct phase
         if self.visualized_result:
             path = self.visualized_result.path or []
@@ -1509,11 +1914,10 @@ class SimulatorGUI:
         
         self._reset_run_state()
         
-        # Redraw grid
-        if self.current_grid:
-            self.draw_grid(self.current_grid)
+        # Undo the run's highlights
+        self.clear_highlights()
         
-        self.status_var.set("Run reset. Ready to re-run.")
+        self._set_var_text(self.status_var, "Run reset. Ready to re-run.")
     
     def full_reset(self) -> None:
         """Full reset - go back to setup."""
@@ -1524,10 +1928,17 @@ class SimulatorGUI:
         self.current_grid = None
         self.grid_source = None
         self.visualization_frame.grid_canvas.delete("all")
+        self.canvas_layout = None
+        self.drawn_state = None
+        self.cell_items = {}
+        self.cell_fills = {}
+        self.highlighted_cells.clear()
+        self.weight_items = {}
+        self.weight_labels = {}
         self.visualization_frame.write_results_text("")
-        self.visualization_frame.compare_result_var.set("")
+        self._set_var_text(self.visualization_frame.compare_result_var, "")
         
-        self.status_var.set("Ready")
+        self._set_var_text(self.status_var, "Ready")
         self.show_setup()
     
     def _reset_run_state(self) -> None:
@@ -1541,11 +1952,15 @@ class SimulatorGUI:
         self.path_prev = None
         self.cumulative_cost = 0.0
         self.path_taken = []
+        self.path_text = ""
         self.best_result = None
         self.visualized_result = None
         self.results = []
-        self.best_var.set("-")
-        self.viz_info_var.set("-")
+        self.results_by_name = {}
+        self.results_text = ""
+        self.result_details = {}
+        self._set_var_text(self.best_var, "-")
+        self._set_var_text(self.viz_info_var, "-")
         self.visualization_frame.write_results_text("")
         self.visualization_frame.update_analytics_button_state(False)
         self.editing_weight = False
@@ -1560,29 +1975,12 @@ class SimulatorGUI:
         """Render algorithm results to the results panel."""
         if self.visualized_result:
             viz = self.visualized_result
-            
-            # Show complete path with all nodes
-            path_detail = ""
-            if viz.path:
-                path_coords = " → ".join([f"({r},{c})" for r, c in viz.path])
-                path_detail = f"Complete Path:\n{path_coords}\n"
-            
-            # Show all explored nodes
-            explored_detail = ""
-            if viz.visited_order:
-                explored_coords = " → ".join([f"({r},{c})" for r, c in viz.visited_order])
-                explored_detail = f"\nExplored Nodes ({len(viz.visited_order)}):\n{explored_coords}\n"
-            
-            info = (
-                f"Algorithm: {viz.name}\n"
-                f"Cost: {viz.cost:.3f} | Nodes explored: {viz.explored_nodes} | Time: {viz.duration:.4f}s\n"
-                f"Path length: {len(viz.path) if viz.path else 0}\n"
-                f"{path_detail}"
-                f"{explored_detail}"
-            )
+            info = self.result_details.get(viz.name)
+            if info is None:
+                info = format_result_details(viz)
             self.viz_info_var.set(info)
         else:
-            self.viz_info_var.set("-")
+            self._set_var_text(self.viz_info_var, "-")
 
         if self.best_result:
             best = self.best_result
@@ -1594,18 +1992,11 @@ class SimulatorGUI:
                 f"Time: {best.duration:.4f}s\n"
                 f"\nBest by: {priority_display}"
             )
-            self.best_var.set(best_summary)
+            self._set_var_text(self.best_var, best_summary)
         else:
-            self.best_var.set("-")
-
-        lines: List[str] = []
-        for res in sorted(self.results, key=lambda r: r.cost):
-            status = "OK" if res.success else "Fail"
-            lines.append(
-                f"{res.name}: cost={res.cost:.3f}, nodes={res.explored_nodes}, "
-                f"time={res.duration:.4f}s, {status}"
-            )
-        self.visualization_frame.write_results_text("\n".join(lines))
+            self._set_var_text(self.best_var, "-")
+
+        self.visualization_frame.write_results_text(self.results_text)
         self.visualization_frame.update_analytics_button_state(bool(self.results))
     
     # === Weight Editing ===
@@ -1619,9 +2010,9 @@ class SimulatorGUI:
         self.editing_weight = enabled
         self.last_painted_cell = None
         if enabled:
-            self.status_var.set("Weight edit mode ON — click or drag to cycle weights.")
+            self._set_var_text(self.status_var, "Weight edit mode ON — click or drag to cycle weights.")
         else:
-            self.status_var.set("Weight edit mode OFF.")
+            self._set_var_text(self.status_var, "Weight edit mode OFF.")
     
     def reset_all_weights(self) -> None:
         """Reset all editable cells to weight 1."""
@@ -1646,7 +2037,7 @@ class SimulatorGUI:
             self.status_var.set("Weights reset. Re-run to apply changes.")
             self.setup_frame._update_summary()
         else:
-            self.status_var.set("Weights are already at default.")
+            self._set_var_text(self.status_var, "Weights are already at default.")
         self.set_weight_edit_mode(False)
     
     def cycle_cell_weight(self, pos: Tuple[int, int]) -> float:
@@ -1672,74 +2063,55 @@ class SimulatorGUI:
     
     def _apply_weight_edit(self, pos: Tuple[int, int]) -> None:
         """Apply a weight cycle edit to the specified position."""
-        if self.current_grid is None:
+        # Drags report many motion events inside one cell; only the first edits it.
+        if self.current_grid is None or self.last_painted_cell == pos:
             return
         if not self.current_grid.in_bounds(pos):
             return
         if pos in (self.current_grid.start, self.current_grid.goal):
-            self.status_var.set("Start and goal cells are locked.")
+            self._set_var_text(self.status_var, "Start and goal cells are locked.")
             return
         cell = self.current_grid.cells.get(pos)
         if cell and cell.obstacle:
-            self.status_var.set("Cannot edit walls.")
-            return
-        if self.last_painted_cell == pos:
+            self._set_var_text(self.status_var, "Cannot edit walls.")
             return
         self.last_painted_cell = pos
         new_value = self.cycle_cell_weight(pos)
-        self._redraw_cell(pos)
+        # The cell is open and not an endpoint, so its weight alone sets the fill.
+        self._set_cell_fill(pos, self._cell_color(self.current_grid, pos, False, new_value))
+        self._set_weight_label(pos, new_value)
         self.weights_dirty = True
         self.visualization_frame.update_analytics_button_state(False)
         self.status_var.set(f"Set weight at {pos} to {new_value}. Re-run to apply.")
-        self.viz_info_var.set("Weights changed. Click Re-run to recompute results.")
-        self.setup_frame._update_summary()
+        self._set_var_text(self.viz_info_var, "Weights changed. Click Re-run to recompute results.")
+        self.setup_frame._schedule_summary()
     
+    @staticmethod
+    def _set_var_text(var: tk.StringVar, text: str) -> None:
+        """Set ``var`` unless it already holds ``text``.
+
+        Every write re-lays out the labels showing the variable, and paint
+        drags repeat the same messages on each motion event.
+        """
+        if var.get() != text:
+            var.set(text)
+
     def _redraw_cell(self, pos: Tuple[int, int]) -> None:
         """Redraw a single cell to reflect its current state."""
         if self.current_grid is None:
             return
         grid = self.current_grid
-        canvas = self.visualization_frame.grid_canvas
-        cell_size = CANVAS_SIZE / max(grid.rows, grid.cols)
-        r, c = pos
-        x1, y1 = c * cell_size, r * cell_size
-        x2, y2 = x1 + cell_size, y1 + cell_size
-        cell = grid.cells.get(pos, Cell())
-        color = "white"
-        if cell.obstacle:
-            color = "#1f2937"
-        elif pos == grid.start:
-            color = "#16a34a"
-        elif pos == grid.goal:
-            color = "#dc2626"
-        elif cell.weight > 1:
-            if cell.weight <= 2:
-                color = "#fed7aa"
-            elif cell.weight <= 3:
-                color = "#fdba74"
-            elif cell.weight <= 5:
-                color = "#fb923c"
-            else:
-                color = "#f97316"
-        canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#e5e7eb")
-        if self.show_weights_var.get():
-            w_text = f"{cell.weight:.0f}" if cell.weight.is_integer() else f"{cell.weight:.1f}"
-            canvas.create_text(
-                (x1 + x2) / 2,
-                (y1 + y2) / 2,
-                text=w_text,
-                fill="#111827",
-                font=("Arial", max(8, int(cell_size // 5))),
-            )
+        cell = grid.cells.get(pos, OPEN_CELL)
+        self._set_cell_fill(pos, self._cell_color(grid, pos, cell.obstacle, cell.weight))
+        self._set_weight_label(pos, cell.weight)
     
     def on_canvas_click(self, event) -> None:
         """Handle canvas click for weight editing or selection."""
         if self.current_grid is None:
             return
         grid = self.current_grid
-        cell_size = CANVAS_SIZE / max(grid.rows, grid.cols)
-        c = int(event.x // cell_size)
-        r = int(event.y // cell_size)
+        c = int(event.x // self.cell_size)
+        r = int(event.y // self.cell_size)
         pos = (r, c)
         if not grid.in_bounds(pos):
             return
@@ -1755,16 +2127,33 @@ class SimulatorGUI:
         if not self.editing_weight or self.current_grid is None:
             return
         grid = self.current_grid
-        cell_size = CANVAS_SIZE / max(grid.rows, grid.cols)
-        c = int(event.x // cell_size)
-        r = int(event.y // cell_size)
+        c = int(event.x // self.cell_size)
+        r = int(event.y // self.cell_size)
         pos = (r, c)
         if not grid.in_bounds(pos):
             return
-        self._apply_weight_edit(pos)
+        # Motion events outpace redraws on fast drags; collect the cells they
+        # cross and paint them together once Tk is idle.
+        pending = self._pending_drag_cells
+        if not pending or pending[-1] != pos:
+            pending.append(pos)
+        if self._drag_job is None:
+            self._drag_job = self.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        """Paint the cells collected by ``on_canvas_drag`` since the last flush."""
+        self._drag_job = None
+        cells, self._pending_drag_cells = self._pending_drag_cells, []
+        if not self.editing_weight:
+            return
+        for pos in cells:
+            self._apply_weight_edit(pos)
     
     def on_canvas_release(self, _event) -> None:
         """Reset drag tracking when mouse button is released."""
+        if self._drag_job is not None:
+            self.root.after_cancel(self._drag_job)
+            self._flush_drag()
         self.last_painted_cell = None
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor
+from operator import attrgetter
 from typing import Callable, Dict, List, Optional, Tuple
 
 from src.grid import Grid
@@ -13,9 +14,10 @@ from src.algorithms import (
     a_star_search,
     ida_star_search,
     bidirectional_search,
-    bidirectional_a_star_search
+    bidirectional_a_star_search,
+    jps_plus_search,
 )
-from src.algorithms.base import timed_run
+from src.algorithms.base import UNREACHABLE, timed_run
 
 
 AlgorithmEntry = Tuple[str, Callable[[Grid], SearchResult]]
@@ -25,7 +27,7 @@ PRIORITY_CRITERIA = ("cost", "nodes", "time")
 DEFAULT_PRIORITY_ORDER = ("cost", "nodes", "time")
 
 
-ALGORITHMS: List[AlgorithmEntry] = [
+ALGORITHMS: Tuple[AlgorithmEntry, ...] = (
     ("BFS", bfs),
     ("DFS", dfs),
     ("Uniform Cost", uniform_cost_search),
@@ -34,19 +36,32 @@ ALGORITHMS: List[AlgorithmEntry] = [
     ("IDA*", ida_star_search),
     ("Bidirectional", bidirectional_search),
     ("Bidirectional Astar", bidirectional_a_star_search),
-]
+    ("JPS+", jps_plus_search),
+)
+
+# Shared by every evaluation so repeated runs reuse warm worker threads
+# instead of starting a pool per call.
+_EXECUTOR = ThreadPoolExecutor(max_workers=len(ALGORITHMS), thread_name_prefix="search")
+
+
+_CRITERION_GETTERS: Dict[str, Callable[[SearchResult], float]] = {
+    "cost": attrgetter("cost"),
+    "nodes": lambda result: float(result.explored_nodes),
+    "time": attrgetter("duration"),
+}
+
+
+def _criterion_getter(criterion: str) -> Callable[[SearchResult], float]:
+    """Return the function reading ``criterion`` from a SearchResult."""
+    try:
+        return _CRITERION_GETTERS[criterion]
+    except KeyError:
+        raise ValueError(f"Unknown criterion: {criterion}") from None
 
 
 def _get_criterion_value(result: SearchResult, criterion: str) -> float:
     """Get the value for a specific criterion from a SearchResult."""
-    if criterion == "cost":
-        return result.cost
-    elif criterion == "nodes":
-        return float(result.explored_nodes)
-    elif criterion == "time":
-        return result.duration
-    else:
-        raise ValueError(f"Unknown criterion: {criterion}")
+    return _criterion_getter(criterion)(result)
 
 
 def _score(result: SearchResult, priority_order: Tuple[str, str, str] = DEFAULT_PRIORITY_ORDER) -> Tuple[float, float, float]:
@@ -60,11 +75,8 @@ def _score(result: SearchResult, priority_order: Tuple[str, str, str] = DEFAULT_
     Returns:
         Tuple of (primary, secondary, tertiary) values for comparison.
     """
-    return (
-        _get_criterion_value(result, priority_order[0]),
-        _get_criterion_value(result, priority_order[1]),
-        _get_criterion_value(result, priority_order[2]),
-    )
+    first, second, third = (_criterion_getter(criterion) for criterion in priority_order)
+    return (first(result), second(result), third(result))
 
 
 def select_best(
@@ -83,12 +95,20 @@ def select_best(
     successful = [r for r in results if r.success]
     if not successful:
         return None
-    return min(successful, key=lambda r: _score(r, priority_order))
+    # Resolve the criteria once rather than per comparison.
+    first, second, third = (_criterion_getter(criterion) for criterion in priority_order)
+    return min(successful, key=lambda r: (first(r), second(r), third(r)))
+
+
+def _run_algorithm(name: str, func: Callable[[Grid], SearchResult], grid: Grid) -> SearchResult:
+    # Module-level so process pools can pickle the submission.
+    return timed_run(name, lambda: func(grid))
 
 
 def evaluate_algorithms(
     grid: Grid,
-    priority_order: Tuple[str, str, str] = DEFAULT_PRIORITY_ORDER
+    priority_order: Tuple[str, str, str] = DEFAULT_PRIORITY_ORDER,
+    executor: Optional[Executor] = None,
 ) -> Tuple[List[SearchResult], Optional[SearchResult]]:
     """Run all algorithms on the grid and find the best one.
     
@@ -96,36 +116,38 @@ def evaluate_algorithms(
         grid: The grid to run algorithms on.
         priority_order: Tuple of 3 criterion names (cost, nodes, time) in priority order.
                        Default is (cost, nodes, time).
+        executor: Where the algorithms run; defaults to the module's shared
+                  thread pool. Submissions are picklable, so a process
+                  pool works as well.
     
     Returns:
         Tuple of (all_results, best_result).
     """
     results: List[SearchResult] = []
-    with ThreadPoolExecutor(max_workers=len(ALGORITHMS)) as executor:
-        futures = {
-            executor.submit(
-                lambda func=func, g=grid.clone(), name=name: timed_run(name, lambda: func(g))
-            ): name
-            for name, func in ALGORITHMS
-        }
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-            except Exception as exc:  # pragma: no cover - guardrail
-                name = futures[future]
-                result = SearchResult(
-                    name=name,
-                    path=[],
-                    cost=float("inf"),
-                    explored_nodes=0,
-                    duration=0.0,
-                    success=False,
-                    visited_order=[],
-                )
-            results.append(result)
+    # Build the search buffers and heuristic tables once, before the searches
+    # start. The algorithms only read the grid, so they all share this one
+    # instance rather than a copy each.
+    grid.precompute_adjacency()
+    grid.manhattan_to(grid.goal)
+    grid.manhattan_to(grid.start)
+    executor = executor or _EXECUTOR
+    futures = [executor.submit(_run_algorithm, name, func, grid) for name, func in ALGORITHMS]
+    # Collect in ``ALGORITHMS`` order, which is also the display order.
+    for (name, _), future in zip(ALGORITHMS, futures):
+        try:
+            result = future.result()
+        except Exception as exc:  # pragma: no cover - guardrail
+            result = SearchResult(
+                name=name,
+                path=[],
+                cost=UNREACHABLE,
+                explored_nodes=0,
+                duration=0.0,
+                success=False,
+                visited_order=[],
+            )
+        results.append(result)
 
     best = select_best(results, priority_order)
-    # Sort results for consistent display
-    results.sort(key=lambda r: (r.name))
     return results, best
 
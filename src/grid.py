@@ -1,21 +1,119 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 import random
 import copy
 
 Position = Tuple[int, int]
+Adjacency = List[Tuple[int, ...]]
 
+_OPEN_DIGITS = bytes.maketrans(b"\x00\x01", b"10")
 
-@dataclass(frozen=True)
-class Cell:
-    """Represents a single grid cell."""
+
+def _bitmap(digits: bytes) -> int:
+    # ``digits`` lists one b"0"/b"1" per node id; bit 0 is node 0, so the
+    # string is reversed before parsing it as binary.
+    return int(b"0" + digits[::-1], 2)
+
+
+class Cell(NamedTuple):
+    """Represents a single grid cell (immutable; a tuple without a ``__dict__``)."""
 
     weight: float = 1.0
     obstacle: bool = False
 
 
+# Cells are immutable, so every position without an entry can share this one.
+OPEN_CELL = Cell()
+
+
+class CellMap(Dict[Position, Cell]):
+    """Cell dict that records edits so data derived from it can be cached.
+
+    ``version`` changes on every edit, ``topology_version`` only when a cell
+    becomes or stops being an obstacle (weight edits keep the adjacency).
+    ``obstacle_count`` and ``weighted_count`` (cells heavier than 1) are kept
+    up to date with each edit.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        self.topology_version = 0
+        self.cache: Dict[str, Tuple[Any, Any]] = {}
+        self.obstacle_count = sum(1 for cell in self.values() if cell.obstacle)
+        self.weighted_count = sum(1 for cell in self.values() if cell.weight > 1)
+
+    def _touch(self, old: Optional[Cell], new: Optional[Cell]) -> None:
+        self.version += 1
+        was_obstacle = old is not None and old.obstacle
+        is_obstacle = new is not None and new.obstacle
+        if was_obstacle != is_obstacle:
+            self.topology_version += 1
+            self.obstacle_count += 1 if is_obstacle else -1
+        self.weighted_count += (new is not None and new.weight > 1) - (old is not None and old.weight > 1)
+
+    def __setitem__(self, pos: Position, cell: Cell) -> None:
+        old = self.get(pos)
+        super().__setitem__(pos, cell)
+        self._touch(old, cell)
+
+    def __delitem__(self, pos: Position) -> None:
+        old = self[pos]
+        super().__delitem__(pos)
+        self._touch(old, None)
+
+    def pop(self, pos: Position, *default: Any) -> Any:
+        if pos not in self:
+            return super().pop(pos, *default)
+        old = super().pop(pos)
+        self._touch(old, None)
+        return old
+
+    def popitem(self) -> Tuple[Position, Cell]:
+        item = super().popitem()
+        self._touch(item[1], None)
+        return item
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild the cells through ``__init__`` before restoring the
+        # counters; the default dict protocol replays ``__setitem__`` on an
+        # instance that has no ``version`` yet.
+        return (CellMap, (dict(self),), self.__dict__)
+
+    def setdefault(self, pos: Position, default: Cell = OPEN_CELL) -> Cell:
+        if pos not in self:
+            self[pos] = default
+        return self[pos]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for pos, cell in dict(*args, **kwargs).items():
+            self[pos] = cell
+
+    def __ior__(self, other: Any) -> "CellMap":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+        self.topology_version += 1
+        self.obstacle_count = 0
+        self.weighted_count = 0
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CellMap":
+        # Cells are frozen, so a shallow copy is already independent; cached
+        # derived data is read-only and can be shared with the copy. The
+        # counters are copied too rather than recounted by ``__init__``.
+        clone = CellMap.__new__(CellMap)
+        dict.update(clone, self)
+        clone.__dict__.update(self.__dict__)
+        clone.cache = dict(self.cache)
+        memo[id(self)] = clone
+        return clone
+
+
 @dataclass
 class Grid:
     rows: int
@@ -29,14 +127,30 @@ class Grid:
         self.cols = int(self.cols)
         self.start = self._clamp(self.start)
         self.goal = self._clamp(self.goal)
+        if not isinstance(self.cells, CellMap):
+            self.cells = CellMap(self.cells)
 
     def _clamp(self, pos: Position) -> Position:
         r, c = pos
         return (max(0, min(self.rows - 1, r)), max(0, min(self.cols - 1, c)))
 
     def clone(self) -> "Grid":
-        """Deep copy used so algorithms operate on identical instances."""
-        return copy.deepcopy(self)
+        """Independent copy, e.g. to snapshot a grid the user may keep editing.
+
+        Only the cell mapping is duplicated; the frozen cells and the cached
+        derived data are shared with the original.
+        """
+        return Grid(self.rows, self.cols, self.start, self.goal, copy.deepcopy(self.cells))
+
+    @property
+    def obstacle_count(self) -> int:
+        """Number of obstacle cells, maintained by ``CellMap`` as cells change."""
+        return self.cells.obstacle_count
+
+    @property
+    def weighted_count(self) -> int:
+        """Number of cells heavier than the default weight of 1."""
+        return self.cells.weighted_count
 
     @classmethod
     def with_defaults(
@@ -59,7 +173,7 @@ class Grid:
         if weights:
             for pos, w in weights.items():
                 pos = (int(pos[0]), int(pos[1]))
-                if cells.get(pos, Cell()).obstacle:
+                if cells.get(pos, OPEN_CELL).obstacle:
                     continue
                 cells[pos] = Cell(weight=float(w), obstacle=False)
         return cls(rows=rows, cols=cols, start=start, goal=goal, cells=cells)
@@ -79,22 +193,139 @@ class Grid:
         return cell.weight if cell else 1.0
 
     def neighbors(self, pos: Position) -> List[Position]:
+        # Searches use the cached ``precompute_adjacency``; this one-off
+        # lookup checks each side inline instead of via ``is_walkable``.
         r, c = pos
-        candidates = [(r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)]
-        return [p for p in candidates if self.is_walkable(p)]
+        rows, cols, cells = self.rows, self.cols, self.cells
+        return [
+            p
+            for p in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+            if 0 <= p[0] < rows and 0 <= p[1] < cols and not cells.get(p, OPEN_CELL).obstacle
+        ]
 
     def cost(self, current: Position, neighbor: Position) -> float:
         # Movement cost is the weight of the destination cell.
         return self.get_weight(neighbor)
 
-    def as_matrix(self) -> List[List[Cell]]:
-        matrix: List[List[Cell]] = []
-        for r in range(self.rows):
-            row: List[Cell] = []
-            for c in range(self.cols):
-                row.append(self.cells.get((r, c), Cell()))
-            matrix.append(row)
-        return matrix
+    def derived(self, name: str, build: Callable[["Grid"], Any], topology_only: bool = False) -> Any:
+        """Return ``build(self)``, cached on ``cells`` until the next edit.
+
+        With ``topology_only`` the value only depends on which cells are
+        obstacles, so weight edits keep it. Treat cached values as read-only.
+        """
+        cells = self.cells
+        version = getattr(cells, "topology_version" if topology_only else "version", None)
+        cache = getattr(cells, "cache", None)
+        key = (version, self.rows, self.cols)
+        if cache is not None and name in cache and cache[name][0] == key:
+            return cache[name][1]
+        value = build(self)
+        if cache is not None:
+            cache[name] = (key, value)
+        return value
+
+    def flat_weights(self) -> Tuple[bytearray, List[float]]:
+        """Wall flags and cell weights as flat buffers indexed by ``row * cols + col``."""
+        return self.derived("weights", Grid._build_flat_weights)
+
+    def manhattan_to(self, target: Position) -> List[int]:
+        """Manhattan distance from every node to ``target``, indexed by node id.
+
+        The heuristic searches read this table instead of recomputing the
+        distance per relaxation. It only depends on the grid shape, so it is
+        cached per target and shared with clones made afterwards.
+        """
+        return self.derived(f"manhattan_to{target}", lambda grid: grid._build_manhattan(target), topology_only=True)
+
+    def _build_manhattan(self, target: Position) -> List[int]:
+        target_r, target_c = target
+        col_distances = [abs(c - target_c) for c in range(self.cols)]
+        return [abs(r - target_r) + d for r in range(self.rows) for d in col_distances]
+
+    def precompute_adjacency(self) -> Tuple[Adjacency, List[float]]:
+        """Walkable neighbour ids of every node, plus the cost of entering each node.
+
+        Neighbours keep the ``neighbors`` order (up, down, left, right). The
+        adjacency is cached until an obstacle is added or removed, so weight
+        edits and repeated searches on the same grid reuse it.
+        """
+        adjacency = self.derived("adjacency", Grid._build_adjacency, topology_only=True)
+        return adjacency, self.flat_weights()[1]
+
+    def open_bits(self) -> Tuple[int, int, int]:
+        """Walkable cells as an integer bitmap (bit ``row * cols + col``).
+
+        Also returns the masks of cells that may be entered from their left
+        and from their right neighbour, so a whole frontier bitmap can be
+        spread one step with four shifts. Cached until obstacles change.
+        """
+        return self.derived("open_bits", Grid._build_open_bits, topology_only=True)
+
+    def connected(self, a: Position, b: Position) -> bool:
+        """Whether ``b`` can be reached from ``a`` through walkable cells.
+
+        As in the searches, ``a`` itself may be a wall: only the cells
+        stepped onto after it need to be walkable.
+        """
+        if not (self.in_bounds(a) and self.in_bounds(b)):
+            return False
+        cols = self.cols
+        walkable, from_left, from_right = self.open_bits()
+        frontier = 1 << (a[0] * cols + a[1])
+        target = 1 << (b[0] * cols + b[1])
+        if frontier == target:
+            return True
+        if not walkable & target:
+            return False
+        # Flood one BFS level per iteration; ``unseen`` shrinks as cells are reached.
+        unseen = walkable & ~frontier
+        while frontier and not frontier & target:
+            vertical = (frontier << cols) | (frontier >> cols)
+            horizontal = ((frontier << 1) & from_left) | ((frontier >> 1) & from_right)
+            frontier = (vertical | horizontal) & unseen
+            unseen ^= frontier
+        return bool(frontier)
+
+    def _build_flat_weights(self) -> Tuple[bytearray, List[float]]:
+        cols = self.cols
+        walls = bytearray(self.rows * cols)
+        weights = [1.0] * (self.rows * cols)
+        for (r, c), cell in self.cells.items():
+            if not (0 <= r < self.rows and 0 <= c < cols):
+                continue
+            idx = r * cols + c
+            if cell.obstacle:
+                walls[idx] = 1
+            weights[idx] = float(cell.weight)
+        return walls, weights
+
+    def _build_open_bits(self) -> Tuple[int, int, int]:
+        rows, cols = self.rows, self.cols
+        walls = self.flat_weights()[0]
+        walkable = _bitmap(walls.translate(_OPEN_DIGITS))
+        from_left = _bitmap((b"0" + b"1" * (cols - 1)) * rows)
+        from_right = _bitmap((b"1" * (cols - 1) + b"0") * rows)
+        return walkable, from_left, from_right
+
+    def _build_adjacency(self) -> Adjacency:
+        rows, cols = self.rows, self.cols
+        walls = self.flat_weights()[0]
+        adjacency: Adjacency = []
+        append = adjacency.append
+        for r in range(rows):
+            for idx in range(r * cols, (r + 1) * cols):
+                c = idx - r * cols
+                neighbors = []
+                if r > 0 and not walls[idx - cols]:
+                    neighbors.append(idx - cols)
+                if r < rows - 1 and not walls[idx + cols]:
+                    neighbors.append(idx + cols)
+                if c > 0 and not walls[idx - 1]:
+                    neighbors.append(idx - 1)
+                if c < cols - 1 and not walls[idx + 1]:
+                    neighbors.append(idx + 1)
+                append(tuple(neighbors))
+        return adjacency
 
     @staticmethod
     def random_grid(
@@ -106,25 +337,19 @@ class Grid:
         seed: Optional[int] = None,
     ) -> "Grid":
         rng = random.Random(seed)
-        obstacles: Set[Position] = set()
-        weights: Dict[Position, float] = {}
-
-        for r in range(rows):
-            for c in range(cols):
-                if (r, c) in [(0, 0), (rows - 1, cols - 1)]:
-                    continue
-                roll = rng.random()
-                if roll < obstacle_ratio:
-                    obstacles.add((r, c))
-                elif roll < obstacle_ratio + weighted_ratio:
-                    weights[(r, c)] = round(rng.uniform(*weight_range), 2)
-
-        return Grid.with_defaults(
-            rows=rows,
-            cols=cols,
-            start=(0, 0),
-            goal=(rows - 1, cols - 1),
-            obstacles=obstacles,
-            weights=weights,
-        )
+        roll, uniform = rng.random, rng.uniform
+        low, high = weight_range
+        weighted_limit = obstacle_ratio + weighted_ratio
+        wall = Cell(obstacle=True)
+        cells: Dict[Position, Cell] = {}
+        # Node 0 is the start and the last node the goal; both stay open. The
+        # remaining cells draw from ``rng`` in row-major order, so a seed
+        # always yields the same grid.
+        for idx in range(1, rows * cols - 1):
+            value = roll()
+            if value < obstacle_ratio:
+                cells[divmod(idx, cols)] = wall
+            elif value < weighted_limit:
+                cells[divmod(idx, cols)] = Cell(weight=round(uniform(low, high), 2))
 
+        return Grid(rows, cols, start=(0, 0), goal=(rows - 1, cols - 1), cells=cells)
@@ -6,10 +6,14 @@ from typing import Sequence
 from src.grid import Grid
 
 WEIGHT_CYCLE_VALUES = [1.0, 2.0, 3.0, 5.0, 10.0]
+# Painted cells hold these exact floats, so most clicks resolve with one lookup.
+_NEXT_DEFAULT_WEIGHT = dict(zip(WEIGHT_CYCLE_VALUES, WEIGHT_CYCLE_VALUES[1:] + WEIGHT_CYCLE_VALUES[:1]))
 
 
 def next_weight_value(current: float, values: Sequence[float] = WEIGHT_CYCLE_VALUES) -> float:
     """Return the next weight in the configured cycle."""
+    if values is WEIGHT_CYCLE_VALUES and current in _NEXT_DEFAULT_WEIGHT:
+        return _NEXT_DEFAULT_WEIGHT[current]
     if not values:
         return current
     for idx, value in enumerate(values):
@@ -23,6 +27,6 @@ def grid_has_custom_weights(grid: Grid, tolerance: float = 1e-6) -> bool:
     for cell in grid.cells.values():
         if cell.obstacle:
             continue
-        if not math.isclose(cell.weight, 1.0, abs_tol=tolerance):
+        if abs(cell.weight - 1.0) > tolerance:
             return True
     return False
@@ -0,0 +1,175 @@
+"""Correctness checks shared by every search algorithm."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.grid import Cell, Grid
+from src.presets import get_preset, list_presets
+from src.evaluator import ALGORITHMS, evaluate_algorithms
+from src.algorithms import (
+    bfs,
+    uniform_cost_search,
+    a_star_search,
+    bidirectional_a_star_search,
+    ida_star_search,
+    jps_plus_search,
+)
+from src.algorithms.base import NodeSequence
+
+
+def _random_grids():
+    return [Grid.random_grid(12, 12, obstacle_ratio=0.2, weighted_ratio=0.2, seed=seed) for seed in range(5)]
+
+
+def _assert_valid_path(grid, result):
+    path = list(result.path)
+    assert path[0] == grid.start
+    assert path[-1] == grid.goal
+    for prev, pos in zip(path, path[1:]):
+        assert abs(prev[0] - pos[0]) + abs(prev[1] - pos[1]) == 1
+        assert grid.is_walkable(pos)
+
+
+@pytest.mark.parametrize("name,func", ALGORITHMS)
+def test_paths_are_valid_on_random_grids(name, func):
+    for grid in _random_grids():
+        result = func(grid)
+        if result.success:
+            _assert_valid_path(grid, result)
+        else:
+            assert list(result.path) == []
+            assert result.cost == float("inf")
+
+
+@pytest.mark.parametrize("preset", list_presets())
+def test_all_algorithms_solve_presets(preset):
+    grid = get_preset(preset)
+    for name, func in ALGORITHMS:
+        result = func(grid)
+        if not result.applicable:
+            assert name == "JPS+" and grid.weighted_count
+            continue
+        assert result.success, name
+        _assert_valid_path(grid, result)
+
+
+def test_optimal_algorithms_agree_on_cost():
+    # Presets carry integer weights (bucket queue path); random grids use fractional weights.
+    for grid in _random_grids() + [get_preset(name) for name in list_presets()]:
+        ucs = uniform_cost_search(grid)
+        for func in (a_star_search, bidirectional_a_star_search, ida_star_search, jps_plus_search):
+            result = func(grid)
+            if not result.applicable:
+                continue
+            assert result.success == ucs.success
+            if ucs.success:
+                assert result.cost == pytest.approx(ucs.cost)
+
+
+def test_blocked_goal_reports_failure():
+    grid = Grid.with_defaults(rows=4, cols=4, obstacles={(0, 1), (1, 0)})
+    for name, func in ALGORITHMS:
+        result = func(grid)
+        assert not result.success, name
+
+
+def test_ida_star_follows_paths_deeper_than_recursion_limit():
+    grid = Grid.with_defaults(rows=1, cols=2000)
+    result = ida_star_search(grid)
+    assert result.success
+    assert len(result.path) == 2000
+    assert result.cost == pytest.approx(1999.0)
+
+
+def test_node_sequence_behaves_like_position_list():
+    seq = NodeSequence([0, 5, 7], cols=3)
+    assert list(seq) == [(0, 0), (1, 2), (2, 1)]
+    assert seq == [(0, 0), (1, 2), (2, 1)]
+    assert seq[1] == (1, 2) and seq[-1] == (2, 1)
+    assert seq[1:].positions() == [(1, 2), (2, 1)]
+    assert (1, 2) in seq and len(seq) == 3
+
+
+def test_cached_adjacency_follows_cell_edits():
+    grid = Grid.with_defaults(rows=3, cols=3)
+    assert a_star_search(grid).cost == pytest.approx(4.0)
+
+    grid.cells[(0, 1)] = Cell(obstacle=True)
+    grid.cells[(2, 1)] = Cell(weight=5.0)
+    clone = grid.clone()
+    assert a_star_search(grid).cost == pytest.approx(4.0)
+    assert uniform_cost_search(clone).cost == pytest.approx(4.0)
+    assert (0, 1) not in uniform_cost_search(grid).path
+
+    grid.cells.pop((0, 1))
+    assert (0, 1) in bfs(grid).visited_order
+    assert (0, 1) not in bfs(clone).visited_order
+
+
+def test_jps_plus_matches_uniform_cost_on_unweighted_grids():
+    for seed in range(30):
+        grid = Grid.random_grid(15, 11, obstacle_ratio=0.3, weighted_ratio=0.0, seed=seed)
+        grid.start, grid.goal = (seed % 15, 10 - seed % 11), (14 - seed % 7, seed % 11)
+        ucs = uniform_cost_search(grid)
+        result = jps_plus_search(grid)
+        assert result.success == ucs.success
+        if ucs.success:
+            _assert_valid_path(grid, result)
+            assert result.cost == pytest.approx(ucs.cost)
+
+
+def test_grid_connected_agrees_with_bfs():
+    for seed in range(40):
+        grid = Grid.random_grid(9, 13, obstacle_ratio=0.4, weighted_ratio=0.0, seed=seed)
+        assert grid.connected(grid.start, grid.goal) == bfs(grid).success
+    walled = Grid.with_defaults(rows=3, cols=3, obstacles={(0, 1), (1, 1), (2, 1)})
+    assert not walled.connected((0, 0), (2, 2))
+    assert walled.connected((0, 0), (2, 0))
+
+    # A walled start still reaches its open neighbours, as in BFS.
+    walled_start = Grid.with_defaults(rows=3, cols=3)
+    walled_start.cells[walled_start.start] = Cell(obstacle=True)
+    assert walled_start.connected(walled_start.start, walled_start.goal) == bfs(walled_start).success
+    assert ida_star_search(walled_start).success
+
+
+def test_algorithms_leave_the_shared_grid_untouched():
+    grid = Grid.random_grid(12, 12, obstacle_ratio=0.2, weighted_ratio=0.2, seed=3)
+    cells, version = dict(grid.cells), grid.cells.version
+    endpoints = (grid.start, grid.goal)
+    results, best = evaluate_algorithms(grid)
+    assert len(results) == len(ALGORITHMS) and best is not None
+    assert grid.cells == cells and grid.cells.version == version
+    assert (grid.start, grid.goal) == endpoints
+
+
+def test_evaluation_runs_on_a_process_pool():
+    grid = Grid.random_grid(10, 10, obstacle_ratio=0.2, weighted_ratio=0.2, seed=5)
+    expected, _ = evaluate_algorithms(grid)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results, best = evaluate_algorithms(grid, executor=executor)
+    assert [(r.name, r.cost, list(r.path)) for r in results] == [
+        (r.name, r.cost, list(r.path)) for r in expected
+    ]
+    assert best is not None
+
+
+def test_int_cell_weights_are_accepted():
+    grid = Grid.with_defaults(rows=3, cols=3)
+    grid.cells[(0, 1)] = Cell(weight=2)
+    ucs = uniform_cost_search(grid)
+    for name, func in ALGORITHMS:
+        result = func(grid)
+        assert result.success or not result.applicable, name
+    assert a_star_search(grid).cost == pytest.approx(ucs.cost)
+
+
+def test_jps_plus_reports_weighted_grids_as_not_applicable():
+    grid = Grid.with_defaults(rows=3, cols=3, weights={(1, 1): 2.0})
+    result = jps_plus_search(grid)
+    assert not result.applicable and not result.success
+    assert list(result.path) == [] and result.explored_nodes == 0
+    results, best = evaluate_algorithms(grid)
+    assert best is not None and best.name != "JPS+"
+    assert jps_plus_search(Grid.with_defaults(rows=3, cols=3)).applicable
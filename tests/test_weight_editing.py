@@ -1,5 +1,7 @@
 """Tests for weight editing helpers and behavior."""
 
+import pickle
+
 from src.grid import Grid, Cell
 from src.algorithms.base import path_cost
 from src.weight_utils import next_weight_value, WEIGHT_CYCLE_VALUES, grid_has_custom_weights
@@ -26,3 +28,40 @@ def test_custom_weight_affects_path_cost():
     updated_cost = path_cost(grid, path)
     assert updated_cost == 6.0
     assert updated_cost > base_cost
+
+
+def test_cell_counts_follow_edits():
+    grid = Grid.with_defaults(rows=3, cols=3, obstacles={(1, 1)})
+    assert (grid.obstacle_count, grid.weighted_count) == (1, 0)
+
+    grid.cells[(0, 1)] = Cell(weight=5.0, obstacle=False)
+    grid.cells[(1, 1)] = Cell(weight=2.0, obstacle=False)
+    assert (grid.obstacle_count, grid.weighted_count) == (0, 2)
+
+    grid.cells.pop((0, 1))
+    clone = grid.clone()
+    assert (clone.obstacle_count, clone.weighted_count) == (0, 1)
+    grid.cells.clear()
+    assert (grid.obstacle_count, grid.weighted_count) == (0, 0)
+
+
+def test_grid_survives_pickling():
+    grid = Grid.with_defaults(rows=3, cols=3, obstacles={(1, 1)})
+    grid.cells[(0, 1)] = Cell(weight=5.0, obstacle=False)
+    restored = pickle.loads(pickle.dumps(grid))
+    assert restored.cells == grid.cells
+    assert (restored.obstacle_count, restored.weighted_count) == (1, 1)
+    assert path_cost(restored, [(0, 0), (0, 1)]) == path_cost(grid, [(0, 0), (0, 1)])
+
+
+def test_clone_shares_cells_but_not_edits():
+    grid = Grid.with_defaults(rows=3, cols=3, weights={(0, 1): 5.0})
+    weights = grid.flat_weights()
+    clone = grid.clone()
+    assert clone.cells is not grid.cells
+    assert clone.cells[(0, 1)] is grid.cells[(0, 1)]
+    assert clone.flat_weights() is weights
+
+    clone.cells[(1, 1)] = Cell(weight=3.0, obstacle=False)
+    assert (1, 1) not in grid.cells
+    assert (clone.weighted_count, grid.weighted_count) == (2, 1)